@@ -5,5 +5,9 @@ from helpers import utils
 from helpers.dictionary import add_to_dict
 from helpers.environment import Env
 from helpers.files import TestFile, WriteFiles
-from helpers.outputs import check_expected_outputs, check_if_output_exists
+from helpers.outputs import (
+    check_expected_outputs,
+    check_if_output_exists,
+    has_any_output,
+)
 from helpers.wrapper import Wrapper, timestamp
@@ -1,12 +1,58 @@
+from contextlib import contextmanager
 from csv import DictWriter, writer
 from dataclasses import dataclass, field
 from logging import Logger
+from mmap import ACCESS_READ, MADV_SEQUENTIAL, mmap
+from os import stat, stat_result
 from pathlib import Path
-from typing import Dict, List, Union
+from stat import S_ISREG
+from typing import IO, Dict, Iterator, List, Union
 
 from model_training.slurm.suffix import remove_suffixes
 
 
+def safe_stat(file: Union[str, Path]) -> Union[stat_result, None]:
+    """
+    Return the os.stat() result for a file, or None if it can not be found.
+    """
+    try:
+        return stat(file)
+    except OSError:
+        return None
+
+
+@contextmanager
+def replace_when_done(file: Path, mode: str = "w") -> Iterator[IO]:
+    """
+    Write to a '<file>.tmp' file through a 1 MB buffer, and only replace 'file' once the block finishes without an error.
+    """
+    _tmp_path = file.with_name(f"{file.name}.tmp")
+    try:
+        with open(_tmp_path, mode=mode, buffering=1 << 20) as handle:
+            yield handle
+    except BaseException:
+        _tmp_path.unlink(missing_ok=True)
+        raise
+    _tmp_path.replace(file)
+
+
+@contextmanager
+def mapped_lines(file: Union[str, Path]) -> Iterator[Iterator[bytes]]:
+    """
+    Map a file as read only, hint the kernel to read ahead, and provide an iterator over each line as bytes.
+
+    An empty file can not be memory-mapped, so has no lines.
+    """
+    if stat(file).st_size == 0:
+        yield iter(())
+        return
+    with open(file, mode="rb") as data, mmap(
+        data.fileno(), 0, access=ACCESS_READ
+    ) as mapped:
+        mapped.madvise(MADV_SEQUENTIAL)
+        yield iter(mapped.readline, b"")
+
+
 class TestFile:
     """Confirm if a file already exists or not."""
 
@@ -27,7 +73,8 @@ class TestFile:
             msg = ""
         else:
             msg = f"{logger_msg}: "
-        if self.path.is_file():
+        _stat = safe_stat(self.path)
+        if _stat is not None and S_ISREG(_stat.st_mode):
             if debug_mode:
                 self.logger.debug(
                     f"{msg}'{str(self.path)}' already exists... SKIPPING AHEAD"
@@ -49,7 +96,8 @@ class TestFile:
         else:
             msg = f"{logger_msg}: "
 
-        if self.path.is_file() and self.path.stat().st_size != 0:
+        _stat = safe_stat(self.path)
+        if _stat is not None and S_ISREG(_stat.st_mode) and _stat.st_size != 0:
             if debug_mode:
                 self.logger.debug(
                     f"{msg}'{str(self.path)}' already exists... SKIPPING AHEAD"
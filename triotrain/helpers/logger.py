@@ -8,34 +8,35 @@ usage:
 import logging
 from sys import stdout
 
+_DATE_FORMAT = "%Y-%m-%d %I:%M:%S %p"
+_SHORT_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - [%(levelname)s] - %(message)s", datefmt=_DATE_FORMAT
+)
+_LONG_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - [%(levelname)s] - %(name)s.%(funcName)s.line_%(lineno)d: %(message)s",
+    datefmt=_DATE_FORMAT,
+)
+# any level missing from this table uses the long format
+_FORMATTER_BY_LEVEL = {
+    logging.DEBUG: _SHORT_FORMATTER,
+    logging.INFO: _SHORT_FORMATTER,
+    logging.WARNING: _SHORT_FORMATTER,
+}
+
+
 class LogFormatter(logging.Formatter):
     """
     Sets a cutsom log formmat for INFO messages vs debug, warning, and error messages.
-    """
 
-    def format(self, record: logging.LogRecord):
-        # Save the original format configured by the user
-        # when the logger formatter was instantiated
-        format_orig = self._style._fmt
-        self.datefmt = "%Y-%m-%d %I:%M:%S %p"
-
-        if (
-            record.levelno == logging.INFO
-            or record.levelno == logging.DEBUG
-            or record.levelno == logging.WARNING
-        ):
-            self._style._fmt = "%(asctime)s - [%(levelname)s] - %(message)s"
-
-        else:
-            self._style._fmt = "%(asctime)s - [%(levelname)s] - %(name)s.%(funcName)s.line_%(lineno)d: %(message)s"
+    The shared formatters are never modified, so this is thread-safe.
+    """
 
-        # Call the original formatter class to do the grunt work
-        result = super().format(record)
+    def __init__(self) -> None:
+        super().__init__(datefmt=_DATE_FORMAT)
 
-        # Restore the original format configured by the user
-        self._style._fmt = format_orig
+    def format(self, record: logging.LogRecord) -> str:
+        return _FORMATTER_BY_LEVEL.get(record.levelno, _LONG_FORMATTER).format(record)
 
-        return result
 
 def get_file_handler(log_file: str) -> logging.FileHandler:
     """
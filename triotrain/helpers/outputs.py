@@ -1,10 +1,13 @@
 from logging import Logger
-from os import listdir
+from os import fspath, listdir, scandir
+from os import path as p
 from pathlib import Path
-from typing import List, Match, Tuple
+from typing import List, Match, Tuple, Union
 
 import regex
-from natsort import natsorted
+from natsort import natsort_keygen
+
+_NATSORT_KEY = natsort_keygen()
 
 
 def check_if_output_exists(
@@ -47,24 +50,30 @@ def check_if_output_exists(
             identifies non-specific regular expression errors
     """
     files: List[str] = list()
-    n_matches = 0
+    n_matches: int = 0
+    num_unique_files: int
+    unique_files_list: List[str]
     if search_path.exists():
         if Path(search_path).is_dir():
-            for file in listdir(str(search_path)):
-                match = regex.search(match_pattern, str(file))
+            search_dir: str = fspath(search_path)
+            # compile once (a no-op for a compiled pattern), and bind
+            # the method outside of the loop
+            search = regex.compile(match_pattern).search
+            for file in listdir(search_dir):
+                match = search(file)
                 if match:
                     files.append(match.group())
 
             unique_files = set(files)
             num_unique_files = len(unique_files)
-            unique_files_list = list(natsorted(unique_files))
+            unique_files_list = sorted(unique_files, key=_NATSORT_KEY)
 
             if debug_mode:
                 logger.debug(f"{msg} - [outputs]: files found | {unique_files_list}")
 
+            # a match may only be part of a file name, so confirm it exists
             for file in files:
-                filename: Path = search_path / file
-                if filename.exists():
+                if p.exists(p.join(search_dir, file)):
                     n_matches += 1
         else:
             num_unique_files = 0
@@ -72,7 +81,7 @@ def check_if_output_exists(
     else:
         if not dryrun_mode:
             logger.warning(
-                f"{msg} - [outputs]: unable to search a non-existant path | '{str(search_path)}'"
+                f"{msg} - [outputs]: unable to search a non-existant path | '{search_path}'"
             )
         num_unique_files = 0
         unique_files_list = []
@@ -84,7 +93,7 @@ def check_if_output_exists(
         unique_files_list = []
     else:
         if debug_mode:
-            logger.debug(f"{msg} - [outputs]: found [{int(n_matches):,}] {file_type}")
+            logger.debug(f"{msg} - [outputs]: found [{n_matches:,}] {file_type}")
         output_exists = True
 
     if n_matches > num_unique_files:
@@ -94,6 +103,35 @@ def check_if_output_exists(
     return output_exists, n_matches, unique_files_list
 
 
+def has_any_output(match_pattern: Union[str, regex.Pattern], search_path: Path) -> bool:
+    """Confirms if at least one file matching a regular expression already exists.
+
+    Unlike check_if_output_exists(), stops searching at the first match, and does not log or count anything.
+
+    Parameters
+    ----------
+    match_pattern : Union[str, regex.Pattern]
+        a regular expression, either as a string or already compiled
+    search_path : Path
+        where to look for the files
+
+    Returns
+    -------
+    bool
+        if True, a file matching the regular expression was found
+    """
+    search_dir: str = fspath(search_path)
+    search = regex.compile(match_pattern).search
+    try:
+        with scandir(search_dir) as entries:
+            for entry in entries:
+                if search(entry.name) and entry.is_file():
+                    return True
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return False
+
+
 def check_expected_outputs(
     outputs_found: int,
     outputs_expected: int,
@@ -128,22 +166,22 @@ def check_expected_outputs(
         if outputs_expected == 1:
             if verbose:
                 logger.info(
-                    f"{msg}: found the {int(outputs_found):,} expected {file_type}... SKIPPING AHEAD"
+                    f"{msg}: found the {outputs_found:,} expected {file_type}... SKIPPING AHEAD"
                 )
         else:
             logger.info(
-                f"{msg}: found all {int(outputs_found):,} expected {file_type}... SKIPPING AHEAD"
+                f"{msg}: found all {outputs_found:,} expected {file_type}... SKIPPING AHEAD"
             )
         missing_outputs = False
     else:
-        if int(outputs_expected) > int(outputs_found):
+        if outputs_expected > outputs_found:
             logger.info(
-                f"{msg}: missing {int(int(outputs_expected) - int(outputs_found)):,}-of-{int(outputs_expected):,} {file_type}"
+                f"{msg}: missing {outputs_expected - outputs_found:,}-of-{outputs_expected:,} {file_type}"
             )
             missing_outputs = True
         else:
             logger.warning(
-                f"{msg}: found {int(int(outputs_found)-int(outputs_expected)):,} more {file_type} than expected!"
+                f"{msg}: found {outputs_found - outputs_expected:,} more {file_type} than expected!"
             )
             missing_outputs = False
 
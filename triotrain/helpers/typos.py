@@ -1,12 +1,21 @@
 """
 sauce: https://stackoverflow.com/questions/62106645/what-is-efficient-way-to-check-if-current-word-is-close-to-a-word-in-string"""
+from typing import Iterable
 
-import Levenshtein
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import JaroWinkler
+except ImportError:
+    process = None
+    import Levenshtein
 
 
 def check_typos(original_word: str, new_word: str) -> list:
     """checking if current word is close to another word
 
+    When rapidfuzz is installed, every word pair is scored in a single call,
+    otherwise the pairs are scored one-by-one with python-Levenshtein.
+
     Parameters
     ----------
     original_word : str
@@ -20,11 +29,74 @@ def check_typos(original_word: str, new_word: str) -> list:
         contains strings which were highly similar between str1 and str2
     """
     min_similarity = 0.75
+    original_words = original_word.split()
+    new_words = new_word.split()
+    if not original_words or not new_words:
+        return []
+
+    if process is not None:
+        # rows are the new words, columns are the original words
+        scores = process.cdist(
+            new_words, original_words, scorer=JaroWinkler.normalized_similarity
+        )
+        best_indexes = scores.argmax(axis=1)
+        best_scores = scores.max(axis=1)
+        return [
+            original_words[i]
+            for i, score in zip(best_indexes, best_scores)
+            if score >= min_similarity
+        ]
+
     output = []
-    results = [
-        [Levenshtein.jaro_winkler(x, y) for x in original_word.split()] for y in new_word.split()
-    ]
-    for x in results:
-        if max(x) >= min_similarity:
-            output.append(original_word.split()[x.index(max(x))])
+    for y in new_words:
+        best_index = 0
+        best_score = 0.0
+        for index, x in enumerate(original_words):
+            score = Levenshtein.jaro_winkler(x, y)
+            if score > best_score:
+                best_index = index
+                best_score = score
+                # an exact match can not be beaten
+                if best_score >= 1.0:
+                    break
+        if best_score >= min_similarity:
+            output.append(original_words[best_index])
     return output
+
+
+def find_close_matches(word: str, choices: Iterable[str], limit: int = 3) -> list:
+    """find the choices most similar to a word, in a single pass
+
+    Parameters
+    ----------
+    word : str
+        compared for similarity to each choice
+    choices : Iterable[str]
+        values to compare against
+    limit : int, optional
+        the maximum number of matches to return, by default 3
+
+    Returns
+    -------
+    List
+        contains the choices which were highly similar to word, most similar first
+    """
+    min_similarity = 0.75
+    if process is not None:
+        return [
+            match
+            for match, _score, _index in process.extract(
+                word,
+                choices,
+                scorer=JaroWinkler.normalized_similarity,
+                score_cutoff=min_similarity,
+                limit=limit,
+            )
+        ]
+
+    scores = [(Levenshtein.jaro_winkler(x, word), x) for x in choices]
+    return [
+        x
+        for score, x in sorted(scores, key=lambda s: s[0], reverse=True)[:limit]
+        if score >= min_similarity
+    ]
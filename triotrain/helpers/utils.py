@@ -6,8 +6,9 @@ usage:
     from helpers.utils import check_if_all_same, create_deps, get_logger
 """
 import logging
-from random import randint
-from typing import List, Union
+from functools import lru_cache
+from random import randrange
+from typing import List, Sequence, Tuple, Union
 
 from helpers.logger import get_stream_handler
 
@@ -15,8 +16,13 @@ from helpers.logger import get_stream_handler
 def get_logger(name: str) -> logging.Logger:
     """
     Inializes a logging object to handle any print messages
+
+    Repeated calls with the same name re-use the existing logger, rather than
+    attaching another stream handler to it.
     """
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
     logger.setLevel(logging.DEBUG)
     # error_dir = Path(f"errors/tmp_{timestamp()}/")
     # error_log = f"{name}.err"
@@ -33,41 +39,44 @@ def random_with_N_digits(n: int) -> int:
     """
     Create a number of an arbitrary length (n)
     """
-    range_start = 10 ** (n - 1)
-    range_end = (10**n) - 1
-    return randint(range_start, range_end)
+    return randrange(10 ** (n - 1), 10**n)
+
+
+# bounds for an 8-digit dummy slurm job id
+_JOB_ID_START = 10_000_000
+_JOB_ID_STOP = 100_000_000
 
 
 def generate_job_id() -> str:
     """
     Create a dummy slurm job id
     """
-    return f"{random_with_N_digits(8)}"
+    return str(randrange(_JOB_ID_START, _JOB_ID_STOP))
 
 
 def check_if_all_same(
-    list_of_elem: List[Union[str, int]], item: Union[str, int]
+    list_of_elem: Sequence[Union[str, int, None]], item: Union[str, int, None]
 ) -> bool:
     """
-    Using List comprehension, check if all elements in list are same and matches the given item.
+    Using a generator, check if all elements in list are same and matches the given item.
+
+    Stops at the first element that does not match.
     """
-    return all([elem == item for elem in list_of_elem])
+    return all(elem == item for elem in list_of_elem)
 
 
-def find_NaN(list_of_elem: List[Union[str, int, None]]) -> List[int]:
+def find_NaN(list_of_elem: Sequence[Union[str, int, None]]) -> List[int]:
     """
     Returns a list of indexs within a list which are 'None'
     """
-    list = [i for i, v in enumerate(list_of_elem) if v == None]
-    return list
+    return [i for i, v in enumerate(list_of_elem) if v is None]
 
 
-def find_not_NaN(list_of_elem: List[Union[str, int, None]]) -> List[int]:
+def find_not_NaN(list_of_elem: Sequence[Union[str, int, None]]) -> List[int]:
     """
     Returns a list of indexs within a list which are not 'None'
     """
-    list = [i for i, v in enumerate(list_of_elem) if v != None]
-    return list
+    return [i for i, v in enumerate(list_of_elem) if v is not None]
 
 
 def create_deps(num: int = 4) -> List[None]:
@@ -77,6 +86,14 @@ def create_deps(num: int = 4) -> List[None]:
     return [None] * num
 
 
+@lru_cache(maxsize=64)
+def create_deps_view(num: int = 4) -> Tuple[None, ...]:
+    """
+    Create a cached, read-only tuple of None of a certain length.
+    """
+    return (None,) * num
+
+
 def phredGQ_to_Eprob(gq_value: int) -> float:
     """
     Convert reported GQ values back to error probabilities.
@@ -2,26 +2,213 @@
 """
 description: transform VCF into TSV file
 """
-from csv import DictReader
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from logging import Logger
+from os import fspath
 from pathlib import Path
+from shutil import copyfileobj
+from subprocess import DEVNULL, PIPE, CalledProcessError, Popen, TimeoutExpired
 from subprocess import run as run_sub
 from sys import path
-from typing import Dict, List, Union
+from tempfile import TemporaryDirectory
+from typing import Dict, Iterable, List, Tuple, Union
+
+try:
+    from cyvcf2 import VCF
+except ImportError:
+    VCF = None
 
 abs_path = Path(__file__).resolve()
 module_path = str(abs_path.parent.parent)
 path.append(module_path)
 
-from helpers.files import TestFile
+from helpers.files import TestFile, mapped_lines, replace_when_done
 from model_training.slurm.suffix import remove_suffixes
 
 
+# the fixed columns of the '#CHROM' header line, before any sample names
+_VCF_COLUMNS = ("CHROM", "POS", "ID", "REF", "ALT", "QUAL", "FILTER", "INFO")
+
+# argv prefixes for every 'bcftools' subprocess
+_BCFTOOLS_VIEW_H = ("bcftools", "view", "-h")
+_BCFTOOLS_INDEX_S = ("bcftools", "index", "-s")
+_BCFTOOLS_QUERY = ("bcftools", "query")
+
+
+def build_output_format(required_fields: Iterable[str]) -> str:
+    """
+    Create a 'bcftools query' format which only includes the fields requested, so that bcftools skips formatting any unused (e.g. PL) values.
+
+    Fixed VCF columns and 'INFO/<tag>' fields are written once per site; all other fields are written once per sample.
+    """
+    _site_fields = []
+    _sample_fields = []
+    for f in required_fields:
+        if f in _VCF_COLUMNS or f.startswith("INFO/"):
+            _site_fields.append(f"%{f}")
+        else:
+            _sample_fields.append(f"\t%{f}")
+
+    assert (
+        _site_fields
+    ), f"missing a per-site field | {list(required_fields)}\nPlease include at least one of {list(_VCF_COLUMNS)}."
+
+    _output_format = "\t".join(_site_fields)
+    if _sample_fields:
+        _output_format += f"[{''.join(_sample_fields)}]"
+    return f"{_output_format}\n"
+
+
+@lru_cache(maxsize=None)
+def bcftools_has_threads(subcommand: str) -> bool:
+    """
+    Confirm if a 'bcftools' subcommand accepts '--threads', based on its usage message.
+
+    Checked once per process, as older bcftools releases do not support this option for every subcommand.
+    """
+    try:
+        # without an input file, some subcommands would read from stdin instead
+        _usage = run_sub(
+            ["bcftools", subcommand, "--help"],  # type: ignore
+            stdin=DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, TimeoutExpired):
+        return False
+    return "--threads" in _usage.stdout or "--threads" in _usage.stderr
+
+
+def bcftools_threads_args(subcommand: str, threads: int) -> List[str]:
+    """
+    Create the '--threads' arguments for a 'bcftools' subcommand, if used and supported.
+    """
+    if threads > 0 and bcftools_has_threads(subcommand):
+        return ["--threads", str(threads)]
+    return []
+
+
+def count_query_columns(output_format: str, num_samples: int) -> int:
+    """
+    Count the columns a 'bcftools query' format will produce, without running bcftools.
+
+    Fields before '[' are written once per site, and fields inside '[...]' once per sample.
+    """
+    _per_site, _, _per_sample = output_format.partition("[")
+    return _per_site.count("%") + _per_sample.count("%") * num_samples
+
+
+@lru_cache(maxsize=None)
+def parse_query_format(output_format: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Split a 'bcftools query' format into per-site and per-sample fields.
+
+    Cached, as the same format is re-used for every VCF converted in a process.
+    """
+    _output_format = output_format.replace("%", "").replace("]\n", "").rstrip("\n")
+    _per_site, _, _per_sample = _output_format.partition("[")
+    return tuple(_per_site.split("\t")), tuple(_per_sample.strip().split())
+
+
+def list_contigs(vcf: str) -> Union[List[str], None]:
+    """
+    Run 'bcftools index -s' as a Python Subprocess to list the contigs containing records.
+
+    Returns None when the input VCF is not indexed.
+    """
+    bcftools_index = run_sub(
+        [*_BCFTOOLS_INDEX_S, vcf],  # type: ignore
+        capture_output=True,
+        text=True,
+    )
+    if bcftools_index.returncode != 0:
+        return None
+    return [line.split("\t")[0] for line in bcftools_index.stdout.splitlines()]
+
+
+def query_by_contig(
+    vcf: str,
+    contigs: List[str],
+    output_format: str,
+    output_dir: Union[str, Path],
+    threads: int,
+    bcftools_threads: int = 0,
+) -> List[Path]:
+    """
+    Run 'bcftools query' on each contig in parallel, writing one file per contig into 'output_dir'.
+
+    Returns the output files in the same order as 'contigs', so they can be joined back together (e.g. with 'cat').
+    """
+    _outputs = [Path(output_dir) / f"region{i}.tsv" for i in range(len(contigs))]
+
+    def _query(contig: str, output: Path) -> Path:
+        with open(output, mode="w") as file:
+            run_sub(
+                [
+                    *_BCFTOOLS_QUERY,
+                    *bcftools_threads_args("query", bcftools_threads),
+                    "-r",
+                    contig,
+                    "-f",
+                    output_format,
+                    vcf,
+                ],  # type: ignore
+                stdout=file,
+                check=True,
+            )
+        return output
+
+    # each worker only waits on its own bcftools process, so threads are enough
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(_query, contigs, _outputs))
+
+
+@lru_cache(maxsize=4096)
+def read_vcf_header(
+    vcf: str, mtime_ns: int, size: int, threads: int = 0
+) -> Tuple[str, ...]:
+    """
+    Identify the header row only.
+
+    When cyvcf2 is installed, htslib reads the header in-process. Otherwise, run 'bcftools view' as a Python Subprocess.
+
+    The modification time and size are only used to re-read the header if the VCF changes.
+
+    With 'threads', 'bcftools view' uses extra threads to decompress the input.
+    """
+    if VCF is not None:
+        _vcf = VCF(vcf)
+        _samples = tuple(_vcf.samples)
+        _vcf.close()
+        if _samples:
+            return _VCF_COLUMNS + ("FORMAT",) + _samples
+        return _VCF_COLUMNS
+
+    bcftools_view = run_sub(
+        [
+            *_BCFTOOLS_VIEW_H,
+            *bcftools_threads_args("view", threads),
+            vcf,
+        ],  # type: ignore
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # slice off the '#CHROM' line, rather than splitting every header line
+    _last_line = bcftools_view.stdout.rstrip("\n").rpartition("\n")[2]
+    return tuple(_last_line.strip("#").split())
+
+
 @dataclass
 class Convert_VCF:
     """
     Transform a Trio VCF into a TSV file.
+
+    A BCF input is also accepted, and avoids the text parsing done by 'bcftools query' on a VCF.
     """
 
     # required parameters
@@ -37,17 +224,22 @@ class Convert_VCF:
         default="%CHROM\t%POS\t%REF\t%ALT\t%INFO/MCU\t%INFO/MCV[\t%GT\t%GQ]\n"
     )
     tsv_column_names: List[str] = field(default_factory=list)
+    threads: int = 1
+    required_fields: Union[List[str], None] = None
+    bcftools_threads: int = 0
 
     # internal parameters
-    _bcftools_query: run_sub = field(default=None, init=False, repr=False)
+    _bcftools_query: Popen = field(default=None, init=False, repr=False)
+    _first_line: str = field(default="", init=False, repr=False)
+    _query_args: List[str] = field(default_factory=list, init=False, repr=False)
+    _query_tmp_dir: Union[TemporaryDirectory, None] = field(
+        default=None, init=False, repr=False
+    )
     _custom_header_list: List[str] = field(default_factory=list, init=False, repr=False)
     _input_header: List[str] = field(default_factory=list, init=False, repr=False)
-    _intermediate_header: List[str] = field(
-        default_factory=list, init=False, repr=False
-    )
-    _tsv_dict_array: List[Dict[str, str]] = field(
-        default_factory=list, init=False, repr=False
-    )
+    _tsv_header: List[str] = field(default_factory=list, init=False, repr=False)
+    _col_idx: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _tsv_rows: List[List[str]] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.logger_msg is None:
@@ -56,6 +248,9 @@ class Convert_VCF:
         else:
             self._internal_msg = f"{self.logger_msg}: "
 
+        if self.required_fields:
+            self.output_format = build_output_format(self.required_fields)
+
     def check_input(self) -> None:
         """
         Confirm the VCF input file exists.
@@ -68,6 +263,9 @@ class Convert_VCF:
             self._input_file.file_exists
         ), f"non-existant file provided | '{self._input_file.file}'\nPlease provide a valid VCF file."
 
+        self._input_str = fspath(self._input_file.path)
+        # re-used by every 'bcftools query' launched for this VCF
+        self._query_args = ["-f", self.output_format, self._input_str]
         self._prefix_path = remove_suffixes(self._input_file.path)
         self._prefix_name = self._prefix_path.name
 
@@ -76,7 +274,7 @@ class Convert_VCF:
         Determine if intermediate TSV file exists.
         """
         if self.tsv_output and self.tsv_output != self._input_file.path.parent:
-            _output_path = self.tsv_output
+            _output_path = Path(self.tsv_output)
             if self.dry_run:
                 self.logger.info(f"{self._internal_msg}using new output directory...'")
         else:
@@ -99,74 +297,130 @@ class Convert_VCF:
     def get_vcf_headers(self) -> None:
         """
         Run 'bcftools view' as a Python Subprocess to identify the header row only. Transform into a list, and identify sample names.
+
+        Headers are cached per process, and only re-read if the VCF has changed.
         """
         self.logger.info(
             f"{self._internal_msg}identifying VCF headers | '{self._input_file.path.name}'"
         )
-        bcftools_view = run_sub(
-            [
-                "bcftools",
-                "view",
-                "-h",
-                str(self._input_file.path),
-            ],  # type: ignore
-            capture_output=True,
-            text=True,
-            check=True,
+        _stat = self._input_file.path.stat()
+        _header = read_vcf_header(
+            self._input_str, _stat.st_mtime_ns, _stat.st_size, self.bcftools_threads
         )
         self.logger.info(
             f"{self._internal_msg}done identifying VCF headers | '{self._input_file.path.name}'"
         )
-        self._input_header = bcftools_view.stdout.splitlines()[-1].strip("#").split()
+        self._input_header = list(_header)
         self._samples = self._input_header[9:]
 
     def get_tsv_headers(self) -> None:
         """
         Identify output headers based on user input (i.e. 'bcftools query' format entered).
         """
-        _output_format = self.output_format.replace("%", "").replace("]\n", "")
-        _format_cols = _output_format.split("[")
-
-        self._per_site_cols = _format_cols[0].split("\t")
-        self._per_sample_cols = _format_cols[1].strip().split()
+        _per_site, _per_sample = parse_query_format(self.output_format)
+        self._per_site_cols = list(_per_site)
+        self._per_sample_cols = list(_per_sample)
 
-        _updated_sample_cols = []
-        for s in self._samples:
-            for col in self._per_sample_cols:
-                _updated_sample_cols.append(f"{col}_{s}")
+        _updated_sample_cols = [
+            f"{col}_{s}" for s in self._samples for col in self._per_sample_cols
+        ]
         self._custom_header_list = self._per_site_cols + _updated_sample_cols
 
+    def get_regions(self) -> List[str]:
+        """
+        Run 'bcftools index -s' as a Python Subprocess to list the contigs containing records.
+
+        Returns an empty list when the input VCF is not indexed.
+        """
+        _contigs = list_contigs(self._input_str)
+        if _contigs is None:
+            self.logger.warning(
+                f"{self._internal_msg}unable to split 'bcftools query' by contig, as the VCF is not indexed | '{self._input_file.path.name}'"
+            )
+            return []
+        return _contigs
+
     def convert_to_tsv(self) -> None:
         """
-        Run 'bcftools query' as a Python Subprocess, and write the output to an intermediate file.
+        Start 'bcftools query' as a Python Subprocess, with the output streamed through a pipe rather than held in memory.
+
+        With 'threads' > 1 and an indexed VCF, each contig is queried in parallel, and the results are streamed back in the original contig order.
+
+        Only the first line is read here; the rest is consumed by either save_output() or load_raw_data().
         """
         self.logger.info(
             f"{self._internal_msg}converting VCF -> TSV file | '{self._output_file.path.name}'"
         )
-        self._bcftools_query = run_sub(
-            [
-                "bcftools",
-                "query",
-                "-f",
+        _regions = self.get_regions() if self.threads > 1 else []
+
+        if len(_regions) > 1:
+            if self.debug:
+                self.logger.debug(
+                    f"{self._internal_msg}running 'bcftools query' on {len(_regions)} contigs with {self.threads} threads"
+                )
+            # keep the per-contig outputs beside the TSV when possible
+            _tmp_parent = self._output_file.path.parent
+            self._query_tmp_dir = TemporaryDirectory(
+                dir=_tmp_parent if _tmp_parent.is_dir() else None
+            )
+            _region_files = query_by_contig(
+                self._input_str,
+                _regions,
                 self.output_format,
-                str(self._input_file.path),
-            ],  # type: ignore
-            capture_output=True,
+                self._query_tmp_dir.name,
+                self.threads,
+                self.bcftools_threads,
+            )
+            _command = ["cat", *map(fspath, _region_files)]
+        else:
+            _command = [
+                *_BCFTOOLS_QUERY,
+                *bcftools_threads_args("query", self.bcftools_threads),
+                *self._query_args,
+            ]
+
+        self._bcftools_query = Popen(
+            _command,  # type: ignore
+            stdout=PIPE,
             text=True,
-            check=True,
+            bufsize=1 << 20,
         )
+        self._first_line = self._bcftools_query.stdout.readline()
+
+    def finish_query(self) -> None:
+        """
+        Wait for 'bcftools query' to exit once the output has been consumed.
+
+        Raises
+        ------
+        CalledProcessError
+            if 'bcftools query' exited with an error
+        """
+        self._bcftools_query.stdout.close()
+        _return_code = self._bcftools_query.wait()
+        if self._query_tmp_dir is not None:
+            self._query_tmp_dir.cleanup()
+            self._query_tmp_dir = None
+        if _return_code != 0:
+            raise CalledProcessError(_return_code, self._bcftools_query.args)
         self.logger.info(
             f"{self._internal_msg}done converting VCF -> TSV file | '{self._output_file.path.name}'"
         )
 
-        _header_line = self._bcftools_query.stdout.splitlines()[0:1]
-        self._intermediate_header = _header_line[0].split("\t")
+    def query_lines(self) -> Iterable[str]:
+        """
+        Yield every line of 'bcftools query' output, including the line already read to test the headers.
+        """
+        return chain([self._first_line], self._bcftools_query.stdout)
 
     def test_output_headers(self) -> None:
         """
         Confirm number of columns matches expectations.
         """
-        _n_cols_found = len(self._intermediate_header)
+        if not self._first_line:
+            return
+        # count the delimiters, rather than splitting the line into a list
+        _n_cols_found = self._first_line.count("\t") + 1
         assert _n_cols_found == len(
             self._custom_header_list
         ), f"unexpected column headers | {_n_cols_found} != {len(self._custom_header_list)}"
@@ -182,43 +436,74 @@ class Convert_VCF:
                 self.logger.debug(
                     f"{self._internal_msg}saving converted VCF file | '{self._output_file.path.name}'"
                 )
-            file = open(str(self._output_file.path), mode="w")
-
-            # Add custom header to the new TSV
-            file.write(_custom_header_str)
-            file.close()
-            contents = open(str(self._output_file.path), mode="a")
-            contents.write(self._bcftools_query.stdout)
-            contents.close()
+            # only replace the TSV once 'bcftools query' has succeeded
+            with replace_when_done(self._output_file.path) as file:
+                # Add custom header to the new TSV
+                file.write(_custom_header_str)
+                file.write(self._first_line)
+                copyfileobj(self._bcftools_query.stdout, file, 1 << 20)
+                self.finish_query()
             if self.debug:
                 self.logger.debug(f"{self._internal_msg}done saving converted VCF file")
         else:
             self.logger.info(
                 f"{self._internal_msg}pretending to write converted VCF file | '{self._output_file.path.name}'"
             )
-            self.tsv_format = self._bcftools_query.stdout.splitlines()
+            # consumed by load_raw_data() without writing an intermediate file
+            self.tsv_format = self.query_lines()
+
+    @property
+    def _tsv_dict_array(self) -> List[Dict[str, str]]:
+        """
+        Build an array of dicts from the loaded rows, with column names as keys.
+
+            NOTE: prefer get() with the rows in '_tsv_rows', which avoids creating a dict per row.
+        """
+        return [dict(zip(self._tsv_header, row)) for row in self._tsv_rows]
+
+    def get(self, row: List[str], col_name: str) -> str:
+        """
+        Return the value of a column, by name, from a row in '_tsv_rows'.
+        """
+        return row[self._col_idx[col_name]]
+
+    def set_header(self, header: List[str]) -> None:
+        """
+        Record the column names, and their position within each row.
+        """
+        self._tsv_header = header
+        self._col_idx = {name: i for i, name in enumerate(header)}
+
+    def load_rows(self, rows: Iterable[List[str]]) -> None:
+        """
+        Store each row as a list of values, ordered by the header.
+        """
+        if not self.debug:
+            self._tsv_rows.extend(rows)
+            return
+
+        for itr, row in enumerate(rows):
+            if itr % 15000 == 0:
+                self.logger.info(f"{self._internal_msg}completed {itr} records...")
+            self._tsv_rows.append(row)
 
     def load_raw_data(self) -> None:
         """
-        Read lines of a TSV (tab-separated values) file as an array of dicts.
+        Read lines of a TSV (tab-separated values) file as an array of rows.
 
             NOTE: the input file should include a header line consisting of column names.
 
-        Each dict represents a row in the input file, with column names as keys.
+        Each row is a list of values in the input file, and the column names are stored separately.
         """
         # Stream in the convert-tsv stdout to process without writing an intermediate file
         if self.dry_run and not self._output_file.path.exists():
             self.logger.info(
                 f"{self._internal_msg}loading contents from converting VCF -> TSV | '{self._output_file.path.name}'"
             )
-            for itr, line in enumerate(
-                DictReader(
-                    self.tsv_format,
-                    fieldnames=self._custom_header_list,
-                    delimiter="\t",
-                )
-            ):
-                self._tsv_dict_array.insert(itr, line)
+            self.set_header(self._custom_header_list)
+            # 'bcftools query' output is plain tab-delimited text, without quoting
+            self.load_rows(line.rstrip("\n").split("\t") for line in self.tsv_format)
+            self.finish_query()
             self.logger.info(
                 f"{self._internal_msg}done loading contents from converting VCF -> TSV | '{self._output_file.path.name}'"
             )
@@ -228,14 +513,14 @@ class Convert_VCF:
                 self.logger.info(
                     f"{self._internal_msg}loading exisiting TSV file | '{self._output_file.path.name}'"
                 )
-                with open(str(self._output_file.path), mode="r") as data:
-                    # Open the file as read only
-                    for itr, line in enumerate(DictReader(data, delimiter="\t")):
-                        if self.debug and itr % 15000 == 0:
-                            self.logger.info(
-                                f"{self._internal_msg}completed {itr} records..."
-                            )
-                        self._tsv_dict_array.insert(itr, line)
+                with mapped_lines(self._output_file.path) as _lines:
+                    # an empty file has no header or rows to load
+                    _header = next(_lines, None)
+                    if _header is not None:
+                        self.set_header(_header.decode().rstrip("\n").split("\t"))
+                        self.load_rows(
+                            line.decode().rstrip("\n").split("\t") for line in _lines
+                        )
                 self.logger.info(
                     f"{self._internal_msg}done loading exisiting TSV file | '{self._output_file.path.name}'"
                 )
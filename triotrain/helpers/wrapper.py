@@ -1,18 +1,30 @@
-from datetime import datetime
+import sys
+from functools import lru_cache
+from time import localtime, strftime, time
 
-def timestamp():
+_TIMESTAMP_FORMAT = "%Y-%m-%d  %H:%M:%S"
+
+
+@lru_cache(maxsize=1)
+def _format_second(second: int) -> str:
+    return strftime(_TIMESTAMP_FORMAT, localtime(second))
+
+
+def timestamp() -> str:
     """
     Provide the current time in human readable format.
+
+    The formatted string is re-used for repeated calls within the same second.
     """
-    current_datetime = datetime.now()
-    formatted_time = current_datetime.strftime("%Y-%m-%d  %H:%M:%S")
-    return str(formatted_time)
+    return _format_second(int(time()))
 
 
 class Wrapper:
     """Displays whenever a script begins or finishes, creates boundaries for debugging.
     """
 
+    _BORDER = "====="
+
     def __init__(self, name: str, message: str):
         """Create a boundary for the current script
 
@@ -34,4 +46,6 @@ class Wrapper:
         timestamp : str
             formatted datetime stamp indiciating when reaching a script boundary
         """
-        print(f"===== {self.message} of {self.name} @ {time} =====")
+        sys.stdout.write(
+            f"{self._BORDER} {self.message} of {self.name} @ {time} {self._BORDER}\n"
+        )
@@ -6,36 +6,109 @@ usage:
     from pipeline_args import collect_args, check_args
 """
 import argparse
-import importlib
-import json
-from logging import Logger
+import ast
+import shlex
+from functools import lru_cache
+from logging import DEBUG, Logger
+from os.path import isfile, splitext
 from pathlib import Path
 from sys import exit
-from typing import Text
+from typing import Dict, List, Text, Tuple
 
-from helpers.typos import check_typos
+from helpers.typos import find_close_matches
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # use the doc string from __main__
+@lru_cache(maxsize=4)
 def get_docstring(script_name, script_path) -> Text:
-    spec = importlib.util.spec_from_file_location(script_name, script_path)
-    foo = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(foo)
-    return foo.__doc__
+    """
+    Read the module docstring from a script, without importing or executing it.
+    """
+    with open(script_path, mode="r") as script:
+        return ast.get_docstring(
+            ast.parse(script.read(), filename=script_name), clean=False
+        )
+
+
+# the pipeline phases, in the order they run
+_PHASES = (
+    "make_examples",
+    "beam_shuffle",
+    "re_shuffle",
+    "train_eval",
+    "select_ckpt",
+    "call_variants",
+    "compare_happy",
+    "convert_happy",
+    "show_examples",
+)
+_PHASES_SET = frozenset(_PHASES)
+_PHASES_STRING = ",\n\t".join(_PHASES)
+
+# the channels used by the default DeepVariant model
+DEFAULT_CHANNELS = '{"channels": [1, 2, 3, 4, 5, 6, 19]}'
+
+
+class ArgsFileParser(argparse.ArgumentParser):
+    """
+    Reads arguments from an '@</path/file>', which may contain multiple arguments per line, quoted values, and '#' comments.
+    """
+
+    def convert_arg_line_to_args(self, arg_line: str) -> List[str]:
+        return shlex.split(arg_line, comments=True)
+
+
+@lru_cache(maxsize=128)
+def _close_phases(phase: str) -> Tuple[str, ...]:
+    """
+    Find the pipeline phases most similar to an invalid phase name.
+    """
+    return tuple(find_close_matches(phase, _PHASES))
+
+
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated argument into a tuple, skipping any empty values.
+    """
+    return tuple(v for v in value.split(",") if v)
 
 
+def _parse_restart(value: str) -> Dict:
+    """
+    Parse the JSON provided to '--restart-jobs', using orjson when available.
+    """
+    try:
+        if orjson is None:
+            # only imported when '--restart-jobs' is used without orjson
+            import json
+
+            return json.loads(value)
+        return orjson.loads(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid JSON provided | {error}")
+
+
+@lru_cache(maxsize=1)
 def collect_args() -> argparse.ArgumentParser:
     """
     process the command line arguments to execute script.
+
+    NOTE: the parser is cached, so callers should not modify it.
     """
     # get the relative path to the triotrain/ dir
     h_path = Path(__file__).parent.parent.parent
     doc = get_docstring(
         script_name="run_trio_train.py", script_path=str(h_path / "run_trio_train.py")
     )
-    parser = argparse.ArgumentParser(
+    parser = ArgsFileParser(
         description=doc,
         formatter_class=argparse.RawTextHelpFormatter,
+        fromfile_prefix_chars="@",
     )
     parser.add_argument(
         "-v",
@@ -56,7 +129,7 @@ def collect_args() -> argparse.ArgumentParser:
         "--ignore",
         dest="ignore",
         help="comma-separated list of prefixes; used to exclude regions during training (e.g., unmapped contigs or low-quality sex chrs)\nNOTE: requires partial match to @SQ tag from reference genome\nDefault based on ARS-UCD1.2_Btau5.0.1Y\n(default: %(default)s)",
-        type=str,
+        type=_split_csv,
         metavar="<str>",
         default="NKLS,Y",
     )
@@ -198,17 +271,7 @@ def collect_args() -> argparse.ArgumentParser:
         "--phases",
         dest="_phases",
         help=argparse.SUPPRESS,
-        default=[
-            "make_examples",
-            "beam_shuffle",
-            "re_shuffle",
-            "train_eval",
-            "select_ckpt",
-            "call_variants",
-            "compare_happy",
-            "convert_happy",
-            "show_examples",
-        ],
+        default=list(_PHASES),
         required=False,
     )
 
@@ -242,13 +305,11 @@ def collect_args() -> argparse.ArgumentParser:
         metavar="</path/to/regions_file>",
     )
     restart = parser.add_argument_group("re-start the pipeline")
-
-    _phases_string = ",\n\t".join(parser.get_default("_phases"))
     restart.add_argument(
         "--restart-jobs",
         dest="restart_jobs",
-        help=f"provide a JSON dictionary containing phase names as keys, and either:\n- a list of indexs to re-run, or\n- a list of running SLURM job numbers to use as dependencies\nVALID PHASES:\n\t{_phases_string}\n(default: %(default)s)",
-        type=json.loads,
+        help=f"provide a JSON dictionary containing phase names as keys, and either:\n- a list of indexs to re-run, or\n- a list of running SLURM job numbers to use as dependencies\nVALID PHASES:\n\t{_PHASES_STRING}\n(default: %(default)s)",
+        type=_parse_restart,
         default=None,
         metavar='{"phase": [jobid1, jobid2, jobid3]}',
     )
@@ -300,103 +361,49 @@ def collect_args() -> argparse.ArgumentParser:
         "--channel-info",
         dest="channel_info",
         help="input file (.json) or JSON-format string\ncontaines 'channels' as a key, with a list of channel numbers as values\n(default: %(default)s)",
-        default='{"channels": [1, 2, 3, 4, 5, 6, 19]}',
+        default=DEFAULT_CHANNELS,
         metavar="JSON data or file",
     )
     return parser
 
 
+@lru_cache(maxsize=1)
+def _default_map(parser: argparse.ArgumentParser) -> Dict[str, object]:
+    """
+    Collect every default value once, giving the same precedence as parser.get_default().
+    """
+    return {
+        **parser._defaults,
+        **{action.dest: action.default for action in parser._actions},
+    }
+
+
 def get_defaults(parser: argparse.ArgumentParser, arg_name: str) -> str:
     """
     Provide the default values for a pipeline argument
     """
-    return parser.get_default(arg_name)
+    return _default_map(parser).get(arg_name)
 
 
 def get_args(parser: argparse.ArgumentParser) -> argparse.Namespace:
     """
     Return the key=value arguments from the command line
+
+    Long invocations can be saved in a file, and provided as '@</path/file>'.
     """
-    manual_args_list = [
-        "-m",
-        # "triotrain/model_training/metadata/240429_DeepVariantTriosTRUTH_UMAG1_noPopVCF.csv",
-        "triotrain/model_training/metadata/240429_DeepVariantTriosTRUTH_UMAG1_noPopVCF_hellbender.csv",
-        # "triotrain/model_training/metadata/230313_benchmarking.csv",
-        # "triotrain/model_training/metadata/230307_PASS.csv",
-        "--first-genome",
-        "Father",
-        # "Mother",
-        # "None",
-        "--name",
-        "240429_NoPopVCF",
-        # "230313_GIAB",
-        # "220913_NewTrios",
-        # "221118_NewTrios",
-        # "221214_MotherFirst",
-        "-r",
-        "triotrain/model_training/tutorial/resources_used_hellbender.json",
-        # "--demo-mode",
-        # "--show-regions-file",
-        # "region_files/DEMO_PASS1.show_regions.bed",
-        "--num-tests",
-        "19",
-        # "6",
-        "--start-itr",
-        "9",
-        "--stop-itr",
-        # "11",
-        "17",
-        # "30",
-        # "--dry-run",
-        # "--ignore",
-        # "NKLS,MSY",
-        # "--debug",
-        # "--update",
-        # "--custom-checkpoint",
-        # "/storage/hpc/group/UMAG_test/WORKING/jakth2/deep-variant/pretrained_models/DV1.4_WGS.AF_cattle2/model.ckpt-120844",
-        # "/storage/hpc/group/UMAG_test/WORKING/jakth2/deep-variant/pretrained_models/DV1.4_WGS.AF_cattle3/model.ckpt-935368",
-        # "/storage/hpc/group/UMAG_test/WORKING/jakth2/deep-variant/pretrained_models/DV1.4_WGS.AF_cattle4/model.ckpt-282383",
-        # "/storage/hpc/group/UMAG_test/WORKING/jakth2/deep-variant/pretrained_models/DV1.4_WGS.AF_cattle5/model.ckpt-336710",
-        # "/storage/hpc/group/UMAG_test/WORKING/jakth2/deep-variant/pretrained_models/v1.4.0-withIS-noPop/model.ckpt",
-        # "/storage/hpc/group/UMAG_test/WORKING/jakth2/deep-variant/pretrained_models/v1.4.0-withIS-withPop/wgs_af.model.ckpt",
-        # "pretrained_models/v1.4.0-withIS-withPop/wgs_af.model.ckpt",
-        # "--channel-info",
-        # '{"channels": [1, 2, 3, 4, 5, 6, 8, 19]}',
-        # "/storage/hpc/group/UMAG_test/WORKING/jakth2/TRIO_TRAINING_OUTPUTS/220913_NewTrios/PASS11/examples/Mother.example_info.json",
-        # "--use-gpu",
-        # "--benchmark",
-        "--trio-dependencies",
-        "None,None,28935490,None",
-        # "--overwrite",
-        # "--restart-jobs",
-        # '{"train_eval": [1]}',
-        # '{"re_shuffle:Father": [1]}',
-        # '{"call_variants": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19]}',
-        # '{"convert_happy": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19]}',
-        # '{"convert_happy": [2, 3, 4, 5, 6]}',
-    ]
-    # return parser.parse_args(manual_args_list)
     return parser.parse_args()
 
 
 def check_args(args: argparse.Namespace, logger: Logger, default_channels: str) -> None:
     """
+    check to make sure all required flags are provided.
+
     with "--debug", display command line args provided.
 
     with "--dry-run", display a msg.
 
-    check to make sure all required flags are provided.
+    The cheapest checks are run first, so that a missing flag exits before any files are checked.
     """
-    if args.debug:
-        str_args = "COMMAND LINE ARGS USED: "
-        for key, val in vars(args).items():
-            str_args += f"{key}={val} | "
-
-        logger.debug(str_args)
-
-    if args.dry_run:
-        logger.info("option --dry-run set; display commands without running them")
-
     try:
         assert (
             args.name
@@ -407,23 +414,40 @@ def check_args(args: argparse.Namespace, logger: Logger, default_channels: str)
         assert (
             args.first_genome
         ), "missing option --first-genome; Please designate which genome to use to start training for each iteration"
+        assert (
+            args.resource_config
+        ), "missing option --resources; Please designate a path to pipeline compute resources in JSON format"
+
         # Convert the string value from arguments to a 'None' value
         if args.first_genome == "None":
             args.first_genome = None
 
-        assert (
-            args.resource_config
-        ), "missing option --resources; Please designate a path to pipeline compute resources in JSON format"
+        if args.debug and logger.isEnabledFor(DEBUG):
+            logger.debug(
+                "COMMAND LINE ARGS USED: "
+                + " | ".join(f"{key}={val}" for key, val in vars(args).items())
+            )
 
-        assert Path(
-            args.modules
-        ).is_file, f"unable to find the modules file | '{args.modules}'"
+        if args.dry_run:
+            logger.info("option --dry-run set; display commands without running them")
 
         if args.demo_mode and args.show_regions:
             assert (
                 args.show_regions_file
             ), "missing option --show-regions-file; Please designate a path to show_examples subset region in either BED or text format"
 
+        if args.restart_jobs is not None:
+            # warn the user against phase name typos
+            for k in args.restart_jobs:
+                # ignore genome when checking for typos
+                k = k.split(":", 1)[0]
+                if k not in _PHASES_SET:
+                    options_str = "', or '".join(_close_phases(k))
+                    logger.info(
+                        f"invalid phase entered: '{k}', did you mean to enter '{options_str}'?\nExiting..."
+                    )
+                    exit(1)
+
         if args.overwrite:
             assert (
                 args.restart_jobs
@@ -444,42 +468,13 @@ def check_args(args: argparse.Namespace, logger: Logger, default_channels: str)
                     num_runs_to_overwrite == 1
                 ), f"option --overwrite is set, but attempting to run {num_runs_to_overwrite} iterations.\nPlease adjust either --start-itr or --stop-itr flags so that only one iteration will be overwritten at a time"
 
-        if "," in args.ignore:
-            ignore_list = args.ignore.split(",")
-            args.ignore = ignore_list
+        assert isfile(
+            args.modules
+        ), f"unable to find the modules file | '{args.modules}'"
 
-        # warn the user against phase name typos
-        if args.restart_jobs:
-            phase_dict = dict()
-            for k in args.restart_jobs.keys():
-                # ignore genome when checking for typos
-                if ":" in k:
-                    k = k.split(":")[0]
-
-                close_matches = list()
-                if k not in args._phases:
-                    for p in args._phases:
-                        match_found = check_typos(p, k)
-                        if match_found:
-                            close_matches.append(match_found[0])
-                    phase_dict[k] = close_matches
-
-            if phase_dict:
-                for k, l in phase_dict.items():
-                    if isinstance(l, list):
-                        options_str = "', or '".join(l)
-                        logger.info(
-                            f"invalid phase entered: '{k}', did you mean to enter '{options_str}'?\nExiting..."
-                        )
-                        exit(1)
-
-        if args.channel_info == default_channels:
-            use_default_channels = True
-        else:
-            use_default_channels = False
-
-        if args.custom_ckpt:
+        if args.custom_ckpt is not None:
             logger.info("option --custom-ckpt is set")
+            use_default_channels = args.channel_info == default_channels
             if "wgs_af" in args.custom_ckpt and use_default_channels:
                 logger.info(
                     f"option --channel-info is missing, defaults will identified soon..."
@@ -491,9 +486,9 @@ def check_args(args: argparse.Namespace, logger: Logger, default_channels: str)
                 assert (
                     use_default_channels is False
                 ), "--custom-ckpt is a non-default model so --channel-info must be set"
-                if Path(args.channel_info).is_file():
+                if isfile(args.channel_info):
                     assert (
-                        "json" in args.channel_info.lower()
+                        splitext(args.channel_info)[1].lower() == ".json"
                     ), "expected a '.json' file input."
                     logger.info("option --channel-info is set; json file provided")
                 else:
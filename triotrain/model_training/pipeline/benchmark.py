@@ -11,23 +11,67 @@ example:
 
 # Load python libs
 import argparse
+import re
+from concurrent.futures import ThreadPoolExecutor
 from csv import DictReader
 from dataclasses import dataclass, field
 from datetime import timedelta
+from io import StringIO
 from logging import Logger
-from os import environ, getcwd, listdir, path
+from math import isnan, nan
+from os import environ, getcwd, path, scandir
 from pathlib import Path
 from subprocess import CalledProcessError
 from subprocess import run as run_sub
 from sys import exit
-from typing import Dict
+from typing import Dict, List, Tuple
 
 import pandas as pd
+import regex
 from helpers.environment import Env
 from helpers.files import WriteFiles
 from helpers.outputs import check_if_output_exists
 from phase import process_phase
-from regex import compile
+
+# the number of job numbers to request from a single 'sacct' call
+_SACCT_CHUNK_SIZE = 500
+
+# the default number of 'sacct' calls to run at once, which can be
+# lowered with TRIOTRAIN_SACCT_WORKERS if the SLURM database is rate-limited
+_SACCT_MAX_WORKERS = 8
+
+# the columns kept from the first 'sacct' line for each job
+_SACCT_JOB_COLUMNS = [
+    "JobID",
+    "JobName",
+    "State",
+    "ExitCode",
+    "Elapsed",
+    "AllocCPUS",
+    "CPUTime",
+]
+
+# the known types for the per-job resources used,
+# where memory resources are parsed as float by query_sacct()
+_METRICS_DTYPES = {
+    "phase": "category",
+    "State": "category",
+    "MaxRSS_G": "float64",
+    "MaxVMSize_G": "float64",
+}
+
+# the SLURM log file names written by each phase, which are
+# searched by check_if_output_exists() with the regex package
+_PHASE_PATTERNS = {
+    "make_examples": regex.compile(r"examples-parallel-\w+-\w+\.out"),
+    "beam_shuffle": regex.compile(r"beam-shuffle-\w+-\w+\.out"),
+    "re_shuffle": regex.compile(r"re-shuffle-\w+\.out"),
+    "train_eval": regex.compile(r"train-\w+-eval-Child_\d+\.out"),
+    "select_ckpt": regex.compile(r"select-ckpt-\w+\.out"),
+    "call_variants": regex.compile(r"test\d+-\w+\.out"),
+    "compare_happy": regex.compile(r"happy\d+-no-flags-\w+\.out"),
+    "convert_happy": regex.compile(r"convert-\D+\d+-\w+\.out"),
+}
 
 
 def collect_args() -> argparse.Namespace:
@@ -139,23 +183,29 @@ class Benchmark:
     use_neat: bool = False
 
     # internal, imutable values
-    _digits_only = compile(r"\d+")
+    _digits_only = re.compile(r"\d+")
     _job_nums: list = field(default_factory=list, init=False, repr=False)
-    _keep_decimal = compile(r"[^\d.]+")
-    _metrics_list_of_dicts: list = field(default_factory=list, init=False, repr=False)
+    _metrics_rows: list = field(default_factory=list, init=False, repr=False)
     _phases_used: list = field(default_factory=list, init=False, repr=False)
+    _phase_stats: Dict[str, Dict[str, float]] = field(
+        default_factory=dict, init=False, repr=False
+    )
     _phase_core_hours: dict = field(default_factory=dict, init=False, repr=False)
     _resources_used: list = field(default_factory=list, init=False, repr=False)
+    _sacct_counts: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _sacct_jobs: Dict[str, list] = field(default_factory=dict, init=False, repr=False)
+    _sacct_memory: Dict[str, list] = field(default_factory=dict, init=False, repr=False)
+    _seen_job_names: set = field(default_factory=set, init=False, repr=False)
     _skipped_jobs: list = field(default_factory=list, init=False, repr=False)
-    _slurm_jobs: Dict = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
         # variables to save total core time charged
-        self._total_hours = 0
-        self._total_minutes = 0
-        self._total_seconds = 0
+        self._total_time = timedelta(0)
         self._num_jobs = 0
 
+        # the sacct output format is fixed, so the columns are too
+        self.column_names = ["phase", *_SACCT_JOB_COLUMNS, "MaxRSS_G", "MaxVMSize_G"]
+
     def get_sec(self, time_str: str) -> int:
         """
         Get seconds from D-HH:MM:SS or HH:MM:SS time
@@ -176,31 +226,60 @@ class Benchmark:
         h, m, s = hms_string.split(":")
         return int(days) * 86400 + int(h) * 3600 + int(m) * 60 + int(s)
 
-    def get_timedelta(self, total_seconds: int) -> timedelta:
+    def get_timedelta_str(self, total_seconds: pd.Series) -> pd.Series:
         """
-        Convert number of seconds into a timedelta format.
+        Re-formats a column of seconds, rounded to whole seconds, back into the '0-00:00:00' format from SLURM. Used internally by summary() only.
         """
-        return timedelta(seconds=total_seconds)
+        days, remainder = divmod(total_seconds.round().astype("int64"), 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return (
+            days.astype(str)
+            + "-"
+            + hours.astype(str).str.zfill(2)
+            + ":"
+            + minutes.astype(str).str.zfill(2)
+            + ":"
+            + seconds.astype(str).str.zfill(2)
+        )
 
-    def get_timedelta_str(self, tdelta) -> str:
+    def get_core_hours(self) -> Tuple[int, str]:
         """
-        Re-formats a '0 days 00:00:00' timedelta object back into a '0-00:00:00' from SLURM. Used internally by summary() only.
+        Split the running total of CPU time into whole hours, and a 'D-H:M:S' string.
+        Used internally by process_resources() and summary().
         """
-        d = {"days": tdelta.days}
-        d["hours"], remainder = divmod(tdelta.seconds, 3600)
-        d["minutes"], d["seconds"] = divmod(remainder, 60)
-        for key, value in d.items():
-            if key != "days":
-                d[key] = str(value).zfill(2)
-        return f'{d["days"]}-{d["hours"]}:{d["minutes"]}:{d["seconds"]}'
-
-    def str_mem(self, mem: float) -> str:
+        days = self._total_time.days
+        hours, remainder = divmod(self._total_time.seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return days * 24 + hours, f"{days:,}-{hours:,}:{minutes}:{seconds}"
+
+    def update_phase_stats(
+        self, phase: str, elapsed_seconds: int, max_rss: float
+    ) -> None:
         """
-        Re-formats a float memory used back to '00.00G' string.
-        Used internally by process_resources() and summary().
+        Keep a running count, total and maximum of the wall time and memory used per phase.
+        Used internally by process_resources() only.
         """
-        mem_string = f"{round(mem,2)}G"
-        return mem_string
+        stats = self._phase_stats.setdefault(
+            phase,
+            {
+                "count": 0,
+                "sum_seconds": 0,
+                "max_seconds": 0,
+                "mem_count": 0,
+                "sum_mem": 0.0,
+                "max_mem": 0.0,
+            },
+        )
+        stats["count"] += 1
+        stats["sum_seconds"] += elapsed_seconds
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed_seconds)
+
+        # missing memory values are excluded from the memory stats
+        if not isnan(max_rss):
+            stats["mem_count"] += 1
+            stats["sum_mem"] += max_rss
+            stats["max_mem"] = max(stats["max_mem"], max_rss)
 
     def load_variables(self) -> None:
         """
@@ -225,33 +304,21 @@ class Benchmark:
         """
         Look for potential job numbers in log files
         """
-
-        if phase_name == "make_examples":
-            search_pattern = r"examples-parallel-\w+-\w+\.out"
-        elif phase_name == "beam_shuffle":
-            search_pattern = r"beam-shuffle-\w+-\w+\.out"
-        elif phase_name == "re_shuffle":
-            search_pattern = r"re-shuffle-\w+\.out"
-        elif phase_name == "train_eval":
-            search_pattern = r"train-\w+-eval-Child_\d+\.out"
-        elif phase_name == "select_ckpt":
-            search_pattern = r"select-ckpt-\w+\.out"
-        elif phase_name == "call_variants":
-            search_pattern = r"test\d+-\w+\.out"
-        elif phase_name == "compare_happy":
-            search_pattern = r"happy\d+-no-flags-\w+\.out"
-        elif phase_name == "convert_happy":
-            search_pattern = r"convert-\D+\d+-\w+\.out"
-        else:
+        search_pattern = _PHASE_PATTERNS.get(phase_name)
+        if search_pattern is None:
             self.logger.error(
                 f"unable to identify a search pattern for '{phase_name}'... SKIPPING AHEAD"
             )
             return
 
-        search_dirs = [d for d in listdir(str(self._search_path)) if d != "summary"]
+        # DirEntry caches the file type, so is_dir() only needs another stat for symlinks
+        with scandir(self._search_path) as entries:
+            search_dirs = [
+                e.path for e in entries if e.name != "summary" and e.is_dir()
+            ]
 
         if self.args.debug:
-            iter = [search_dirs[0]]
+            iter = search_dirs[:1]
         else:
             iter = search_dirs
 
@@ -259,8 +326,8 @@ class Benchmark:
             logs_exist, total_jobs_in_phase, log_file_names = check_if_output_exists(
                 match_pattern=search_pattern,
                 file_type="SLURM log files",
-                search_path=self._search_path / dir / "logs",
-                label="benchmarking",
+                search_path=Path(dir) / "logs",
+                msg="benchmarking",
                 logger=self.logger,
                 debug_mode=self.args.debug,
                 dryrun_mode=self.args.dry_run,
@@ -276,186 +343,228 @@ class Benchmark:
                         self._job_nums.append(int(match.group()))
                         self._num_jobs += 1
 
-    def open_file(self) -> None:
+    def process_csv_file(self) -> None:
         """
-        Open up a csv file, return a dict with each line in the file.
-        Used internally by process_csv_file() only.
+        Open up the csv file, create a new list of the phases contained in the csv file and a second list containing the SLURM job numbers.
+
+        Rows are processed as they are read, rather than stored first.
         """
         try:
-            assert Path(
-                self.args.csv_file
-            ).exists(), (
-                f"Unable to open [{self.args.csv_file}] because it does not exist"
-            )
-            with open(self.args.csv_file, mode="r") as csv_file:
-                csv_reader = DictReader(csv_file)
+            with open(self.args.csv_file, mode="r", newline="") as csv_file:
                 line_count = 0
-                for row in csv_reader:
-                    line_count += 1
-                    self._slurm_jobs[line_count] = row
+                for line_count, row in enumerate(DictReader(csv_file), start=1):
+                    if "JobList" not in row:
+                        continue
+                    if not row["JobList"]:
+                        self.logger.warning(
+                            f"Skipping a bad input row [# {line_count}:\n{row}]"
+                        )
+                        continue
+
+                    jobs = row["JobList"].split(",")
+                    total_jobs_in_phase = len(jobs)
+                    phase_name = process_phase(row["phase"].lower())
+                    if phase_name in self.list_of_phases:
+                        self._job_nums.extend(jobs)
+                        self._phases_used.extend([phase_name] * total_jobs_in_phase)
+                    else:
+                        self.logger.warning(
+                            f"Skipping {total_jobs_in_phase} jobs in [{phase_name}] phase because not in [{', '.join(self.list_of_phases)}]",
+                        )
                 assert (
-                    self._slurm_jobs
+                    line_count > 0
                 ), f"Unable to load in input data from [{self.args.csv_file}]"
+        except FileNotFoundError:
+            self.logger.error(
+                f"Unable to open [{self.args.csv_file}] because it does not exist\nExiting... "
+            )
+            exit()
         except AssertionError as err:
             self.logger.exception(f"{err}\nExiting... ")
             exit()
 
-    def process_csv_file(self) -> None:
-        """
-        Open up the csv file, create a new list of the phases contained in the csv file and a second list containing the SLURM job numbers.
-        """
-        self.open_file()
-        for key, value in self._slurm_jobs.items():
-            for k, v in value.items():
-                if k == "JobList":
-                    if len(v) != 0:
-                        jobs = v.split(",")
-                        total_jobs_in_phase = len(jobs)
-                        phase_name = process_phase(value["phase"].lower())
-                        if phase_name in self.list_of_phases:
-                            self._job_nums.extend(jobs)
-                            self._phases_used.extend([phase_name] * total_jobs_in_phase)
-                        else:
-                            self.logger.warning(
-                                f"Skipping {total_jobs_in_phase} jobs in [{phase_name}] phase because not in [{', '.join(self.list_of_phases)}]",
-                            )
-                    else:
-                        self.logger.warning(
-                            f"Skipping a bad input row [# {key}:\n{value}]"
-                        )
         self._num_jobs = len(self._job_nums)
         self.logger.info(
             f"Found [{int(self._num_jobs):,}] job numbers for [{Path(self.args.csv_file).name}]"
         )
 
+    def run_sacct(self, job_nums: List[str]) -> str:
+        """
+        Collect the resources used by a chunk of job numbers from 'sacct'.
+        Used internally by query_sacct() only.
+        """
+        # only if the job state=COMPLETED and make the output
+        # parsable with '|' but don't include a trailing '|'
+        resources = run_sub(
+            [
+                "sacct",
+                f"-j{','.join(job_nums)}",
+                "--state=COMPLETED",
+                "--format=JobID,JobName%50,State,ExitCode,Elapsed,Alloc,CPUTime,MaxRSS,MaxVMSize",
+                "--units=G",
+                "--parsable2",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return resources.stdout
+
+    def query_sacct(self) -> None:
+        """
+        Use 'sacct' to collect the resources used by every job number, requesting up to _SACCT_CHUNK_SIZE jobs per call.
+
+        The output is parsed into a single DataFrame, and then split into the job line and the memory used per job number.
+        """
+        unique_jobs = list(dict.fromkeys(str(job) for job in self._job_nums))
+        if not unique_jobs:
+            return
+
+        # the 'sacct' calls mostly wait on the SLURM database, so run them at once
+        chunks = [
+            unique_jobs[start : start + _SACCT_CHUNK_SIZE]
+            for start in range(0, len(unique_jobs), _SACCT_CHUNK_SIZE)
+        ]
+        outputs = []
+
+        try:
+            max_workers = max(
+                1, int(environ.get("TRIOTRAIN_SACCT_WORKERS", _SACCT_MAX_WORKERS))
+            )
+        except ValueError:
+            self.logger.warning(
+                f"invalid TRIOTRAIN_SACCT_WORKERS | '{environ['TRIOTRAIN_SACCT_WORKERS']}'\nUsing the default of {_SACCT_MAX_WORKERS} 'sacct' calls at once instead."
+            )
+            max_workers = _SACCT_MAX_WORKERS
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+            results = [pool.submit(self.run_sacct, chunk) for chunk in chunks]
+            for count, chunk in enumerate(chunks):
+                try:
+                    stdout = results[count].result()
+                except CalledProcessError as err:
+                    self.logger.error(
+                        f"Resource collection stopped at {int(count * _SACCT_CHUNK_SIZE):,}-of-{len(unique_jobs):,} for [Job#s:{chunk[0]}-{chunk[-1]}]",
+                    )
+                    self.logger.error(f"{err}\n{err.stderr}\nExiting... ")
+                    exit(err.returncode)
+
+                if stdout.strip():
+                    outputs.append(
+                        pd.read_csv(
+                            StringIO(stdout),
+                            sep="|",
+                            dtype=str,
+                            keep_default_na=False,
+                        )
+                    )
+
+        if not outputs:
+            return
+
+        # each job has a slurm batch job line, then child process(es)
+        acct = pd.concat(outputs, ignore_index=True)
+        job_ids = acct["JobID"].str.split(".", n=1).str[0]
+        step = acct.groupby(job_ids, sort=False).cumcount()
+
+        # Remove the 'G' from memory resources, and convert to float
+        memory = acct[["MaxRSS", "MaxVMSize"]].apply(
+            lambda col: pd.to_numeric(
+                col.str.replace(r"[^\d.]+", "", regex=True), errors="coerce"
+            )
+        )
+        memory.index = job_ids
+
+        self._sacct_counts = job_ids.value_counts().to_dict()
+        job_lines = acct.loc[step == 0, _SACCT_JOB_COLUMNS]
+        self._sacct_jobs = dict(zip(job_ids[step == 0], job_lines.values.tolist()))
+
+        # use the child process memory, or the max across
+        # training + evaluation child processes for train_eval
+        child_memory = memory[(step == 1).values]
+        step_memory = (
+            memory[(step >= 2).values].groupby(level=0, sort=False).max().round(2)
+        )
+        child_memory = step_memory.combine_first(child_memory)
+        self._sacct_memory = dict(zip(child_memory.index, child_memory.values.tolist()))
+
     def process_resources(self) -> None:
         """
-        Iterate through a list of job numbers, and use 'sacct' to calaculate resources used per job.
+        Iterate through a list of job numbers, and calaculate resources used per job from the 'sacct' output.
         """
+        # only count the core hours for each job number + phase once
+        unique_pairs = dict.fromkeys(zip(self._job_nums, self._phases_used))
+        if len(unique_pairs) < len(self._job_nums):
+            self.logger.info(
+                f"Removed [{int(len(self._job_nums) - len(unique_pairs)):,}] duplicate job numbers"
+            )
+            self._job_nums = [job for job, _ in unique_pairs]
+            self._phases_used = [phase for _, phase in unique_pairs]
+            self._num_jobs = len(self._job_nums)
 
-        for count, job in enumerate(self._job_nums):
-            current_phase = self._phases_used[count]
+        self.query_sacct()
 
-            if "neat" in current_phase:
-                if not self.use_neat and self.use_default_phases:
-                    # define the row index order
-                    self.indexes = self.list_of_phases[:-1]
-                    if self.args.debug:
-                        self.logger.debug(f"--use_neat is unset; skipping job [{job}]")
-                    continue
-            else:
-                self.indexes = self.list_of_phases
-
-            # Initalize the lists that will become a dictionary
-            keys = ["phase"]
-            values = [current_phase]
-
-            try:
-                # Collect the resources used by the current job number
-                # if the job state=COMPLETED and make the output
-                # parsable with '|' but don't include a trailing '|'
-                resources = run_sub(
-                    [
-                        "sacct",
-                        f"-j{job}",
-                        "--state=COMPLETED",
-                        "--format=JobID,JobName%50,State,ExitCode,Elapsed,Alloc,CPUTime,MaxRSS,MaxVMSize",
-                        "--units=G",
-                        "--parsable2",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-            except CalledProcessError as err:
-                self.logger.error(
-                    f"Resource collection stopped at {int(count):,}-of-{int(self._num_jobs):,} for [Job#:{job}]",
-                )
-                self.logger.error(f"{err}\n{err.stderr}\nExiting... ")
-                exit(err.returncode)
+        # define the row index order
+        skip_neat = not self.use_neat and self.use_default_phases
+        if skip_neat:
+            self.indexes = self.list_of_phases[:-1]
+        else:
+            self.indexes = self.list_of_phases
 
-            # remove trailing new line from output string
-            # and split lines into a list of 3 lines (header, slurm batch job, child process(es))
-            output = resources.stdout.strip().split("\n")
+        for count, (job, current_phase) in enumerate(
+            zip(self._job_nums, self._phases_used)
+        ):
+            if skip_neat and "neat" in current_phase:
+                if self.args.debug:
+                    self.logger.debug(f"--use_neat is unset; skipping job [{job}]")
+                continue
 
-            # parse out the header line
-            metric_names = output[0].split("|")[:9]
+            # the number of lines reported for the slurm batch job + child process(es)
+            num_lines = self._sacct_counts.get(str(job), 0)
 
             # some jobs may have more than 1 child process
-            if len(output) == 3:
-                # parse out the more informative job name + jobid line
-                core_hours = output[1].split("|")[:7]
-
-                # grab the child process(es) memory usage
-                memory = output[2].split("|")[7:9]
-
-                self._resources_used = core_hours + memory
-            elif len(output) > 3:
-                if "train_eval" in current_phase:
-                    core_hours = output[1].split("|")[:7]
-                    train_memory = output[3].split("|")[7:9]
-                    eval_memory = output[4].split("|")[7:9]
-                    RSS1 = float(self._keep_decimal.sub("", train_memory[0]))
-                    RSS2 = float(self._keep_decimal.sub("", eval_memory[0]))
-                    max_RSS = max(RSS1, RSS2)
-                    VM1 = float(self._keep_decimal.sub("", train_memory[1]))
-                    VM2 = float(self._keep_decimal.sub("", eval_memory[1]))
-                    max_VM = max(VM1, VM2)
-                    max_memory = [self.str_mem(max_RSS), self.str_mem(max_VM)]
-                    self._resources_used = core_hours + max_memory
-                else:
-                    self.logger.error(
-                        f"I haven't been told  how to handle {len(output)} child process(es) {current_phase} yet!\n{output}",
-                    )
-                    exit(2)
-            elif len(output) < 3:
-                self._skipped_jobs.append(job)
-                self.logger.warning(
-                    f"Skipping job [{job}] because invalid output format\n{output}"
+            if num_lines == 2 or (num_lines > 2 and "train_eval" in current_phase):
+                # the more informative job name + jobid line, then
+                # the child process(es) memory usage
+                self._resources_used = (
+                    self._sacct_jobs[str(job)] + self._sacct_memory[str(job)]
                 )
-                continue
-            else:
+            elif num_lines > 2:
                 self.logger.error(
-                    f"I haven't been told  how to handle {len(output)} child process(es) {current_phase} yet!\n{output}",
+                    f"I haven't been told  how to handle {num_lines} child process(es) {current_phase} yet!",
                 )
                 exit(2)
+            else:
+                self._skipped_jobs.append(job)
+                self.logger.warning(
+                    f"Skipping job [{job}] because invalid output format"
+                )
+                continue
 
             # Convert CPUTime in days into seconds
             CPUTime = self._resources_used[6]
             CPU_seconds = self.get_sec(CPUTime)
 
             # keep a rolling total of CORE HOUR USAGE ------------
-            self._total_seconds += CPU_seconds
-            print(current_phase)
-            print(self._total_seconds)
-            add_minute, remainder_s = divmod(self._total_seconds, 60)
-            self._total_minutes += add_minute
-            self._total_seconds = remainder_s
-            add_hour, remainder_m = divmod(self._total_minutes, 60)
-            self._total_hours += add_hour
-            self._total_minutes = remainder_m
-            add_day, remainder_h = divmod(self._total_hours, 24)
-            self._total_days = add_day
-
-            # Remove the 'G' from memory resources ---------------
-            # convert from int to float
-            MaxRSS = float(self._keep_decimal.sub("", self._resources_used[7]))
-            MaxVMSize = float(self._keep_decimal.sub("", self._resources_used[8]))
-            self._resources_used[7] = str(MaxRSS)
-            self._resources_used[8] = str(MaxVMSize)
-
-            # Add the unit back to column name
-            metric_names[7] = "MaxRSS_G"
-            metric_names[8] = "MaxVMSize_G"
-
-            # combine phase with resource usage data
-            keys.extend(metric_names)
-            values.extend(self._resources_used)
-
-            # save clean data to a dictionary
-            d = dict(zip(keys, values))
-            self._metrics_list_of_dicts.append(d)
-            self.column_names = list(self._metrics_list_of_dicts[0].keys())
+            self._total_time += timedelta(seconds=CPU_seconds)
+
+            # Accumulate the per-phase summary stats, while
+            # only averaging usage across non-replicate jobs
+            job_name = self._resources_used[1]
+            if job_name not in self._seen_job_names:
+                self._seen_job_names.add(job_name)
+                self.update_phase_stats(
+                    current_phase,
+                    self.get_sec(self._resources_used[4]),
+                    self._resources_used[7],
+                )
+
+            # Only keep every row of clean data for debugging
+            if self.args.debug:
+                # combine phase with resource usage data, in the same
+                # order as self.column_names
+                row = (current_phase, *self._resources_used)
+                self._metrics_rows.append(row)
 
             # Print a status message for chunks of jobs
             if self.args.debug:
@@ -467,101 +576,60 @@ class Benchmark:
                 self.logger.info(
                     f"finished {int(count + 1):,}-of-{int(self._num_jobs):,} jobs"
                 )
-                self._core_hours_str = f"{int(self._total_days):,}-{int(remainder_h):,}:{int(self._total_minutes)}:{self._total_seconds}"
+                total_hours, core_hours_str = self.get_core_hours()
                 self.logger.info(
-                    f"running total CORE HOURS = {int(self._total_hours):,} | {self._core_hours_str}",
+                    f"running total CORE HOURS = {total_hours:,} | {core_hours_str}",
                 )
                 if self.args.debug:
-                    self.logger.debug(f"row{int(count + 1):,} = {d}")
+                    self.logger.debug(
+                        f"row{int(count + 1):,} = {dict(zip(self.column_names, row))}"
+                    )
 
     def summary(self) -> None:
         """
         Calculate summary stats about resourced used for each phase.
         """
-        # convert dict obj to dataframe
-        df = pd.DataFrame.from_records(
-            self._metrics_list_of_dicts, columns=self.column_names
-        )
-
-        # Ensure you only average usage across non-replicate jobs
-        df = df.drop_duplicates(subset=["JobName"])
-
-        df.insert(
-            loc=6,
-            column="Elapsed_seconds",
-            value=df[["Elapsed"]].applymap(self.get_sec),
-        )
-
-        # Convert to str to timedelta obj for descriptive stats
-        df.insert(
-            loc=7,
-            column="Elapsed_Time",
-            value=df[["Elapsed_seconds"]].applymap(self.get_timedelta),
-        )
-
-        # Convert to str to float obj for descriptive stats
-        df[["MaxRSS_G", "MaxVMSize_G"]] = df[["MaxRSS_G", "MaxVMSize_G"]].apply(
-            pd.to_numeric
-        )
-
-        if self.args.debug:
-            self.logger.debug(f"accounting output for all jobs |'")
-            print(
-                "---------------------------------------------------------------------------------------------------------------------------------------"
-            )
-            print(df)
-            print(
-                "---------------------------------------------------------------------------------------------------------------------------------------"
-            )
-
-        # handle elapsed wall time
-        durration_summary = pd.DataFrame(
-            df.groupby("phase").Elapsed_Time.describe(datetime_is_numeric=False)[
-                ["count", "mean", "max"]
-            ]
-        )
-        durration_summary[["mean", "max"]] = durration_summary[
-            ["mean", "max"]
-        ].applymap(self.get_timedelta_str)
-        durration_summary.reindex(self.indexes)
-
         if self.args.debug:
+            # convert the rows of tuples to dataframe
+            df = pd.DataFrame.from_records(
+                self._metrics_rows, columns=self.column_names
+            ).astype(_METRICS_DTYPES)
             self.logger.debug(
-                f"Duration\n---------------------------------------------\n{durration_summary}\n---------------------------------------------",
+                f"accounting output for all jobs |\n---------------------------------------------\n{df}\n---------------------------------------------"
             )
 
-        # handle REAL memory usage
-        real_mem_summary = pd.DataFrame(
-            df.groupby("phase").MaxRSS_G.describe()[["count", "mean", "max"]]
-        )
-
-        real_mem_summary[["mean", "max"]] = real_mem_summary[["mean", "max"]].applymap(
-            self.str_mem
+        # build the summary from the running stats kept by process_resources()
+        summary_rows = {}
+        for phase, stats in sorted(self._phase_stats.items()):
+            mem_count = stats["mem_count"]
+            summary_rows[phase] = {
+                "job_count": stats["count"],
+                "mean_runtime": stats["sum_seconds"] / stats["count"],
+                "max_runtime": stats["max_seconds"],
+                "mean_mem": stats["sum_mem"] / mem_count if mem_count else nan,
+                "max_mem": stats["max_mem"] if mem_count else nan,
+            }
+
+        self._merged_df = pd.DataFrame.from_dict(
+            summary_rows,
+            orient="index",
+            columns=["job_count", "mean_runtime", "max_runtime", "mean_mem", "max_mem"],
         )
-        real_mem_summary.reindex(self.indexes)
-
-        if self.args.debug:
-            self.logger.debug(
-                f"Memory Used\n---------------------------------------------\n{real_mem_summary}\n---------------------------------------------"
+        self._merged_df.index.name = "phase"
+
+        # format the wall time and memory used for each column at once
+        for column in ["mean_runtime", "max_runtime"]:
+            self._merged_df[column] = self.get_timedelta_str(self._merged_df[column])
+        for column in ["mean_mem", "max_mem"]:
+            self._merged_df[column] = (
+                self._merged_df[column].astype("float64").round(2).astype(str) + "G"
             )
 
-        # Merge and clean up the two dfs ------------
-        # remove duplicate columns to avoid 2 count columns with the same value
-        counts = list(durration_summary["count"])
-        durration_summary.drop("count", inplace=True, axis=1)
-        real_mem_summary.drop("count", inplace=True, axis=1)
-
-        # join 2 dataframes
-        self._merged_df = durration_summary.join(
-            real_mem_summary, lsuffix="_runtime", rsuffix="_mem"
+        # keep the rows in run_order, without adding empty phases
+        self._merged_df = self._merged_df.reindex(
+            [phase for phase in self.indexes if phase in summary_rows]
         )
 
-        # add back the job count column
-        self._merged_df.insert(0, "job_count", counts)
-
-        # keep the rows in run_order
-        self._merged_df.reindex(self.indexes)
-
         # add the phase core hours
         self._merged_df.loc[list(self._phase_core_hours), "core_hours"] = pd.Series(
             self._phase_core_hours
@@ -573,8 +641,9 @@ class Benchmark:
         self.logger.info(
             f"Resources Used per phase\n===============================\n{self._merged_df}\n===============================",
         )
+        total_hours, core_hours_str = self.get_core_hours()
         self.logger.info(
-            f"Finished all {int(self._num_jobs):,} jobs\n======= {int(self._num_jobs - len(self._skipped_jobs)):,}-of-{int(self._num_jobs):,} JOBS =======\nTOTAL CORE HOURS = {int(self._total_hours):,} | {self._core_hours_str}\n===============================",
+            f"Finished all {int(self._num_jobs):,} jobs\n======= {int(self._num_jobs - len(self._skipped_jobs)):,}-of-{int(self._num_jobs):,} JOBS =======\nTOTAL CORE HOURS = {total_hours:,} | {core_hours_str}\n===============================",
         )
 
         if len(self._skipped_jobs) > 0:
@@ -14,13 +14,21 @@ from json import dump, dumps
 from os import environ
 from os import path as p
 from pathlib import Path
-from re import fullmatch
+from re import compile
 from sys import exit
 from typing import Dict, List, Union
 
 from phase import process_phase
 from resources import process_resource
 
+# regular expressions representing email format expectations,
+# checked separately on either side of the last '@'
+_LOCAL_RE = compile(r"[A-Za-z0-9._%+-]{1,64}")
+_DOM_RE = compile(r"[A-Za-z0-9.-]{1,255}\.[A-Za-z]{2,}")
+
+# regular expression representing days-Hours:Minutes:Seconds
+_TIME_RE = compile(r"\d-\d{2}:\d{2}:\d{2}")
+
 
 def collect_args() -> argparse.Namespace:
     """Handles the command line arguments.
@@ -160,10 +168,9 @@ def check_email(email: str) -> None:
     email : str
         where to send SLURM job status emails
     """
-    # regular expression representing email format expectations
-    regex = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-    # pass the string into the fullmatch() method
-    assert fullmatch(regex, email), f"Email [{email}] is invalid"
+    local, _, domain = email.rpartition("@")
+    is_valid = _LOCAL_RE.fullmatch(local) and _DOM_RE.fullmatch(domain)
+    assert is_valid, f"Email [{email}] is invalid"
 
 
 def check_time(time_str: str) -> None:
@@ -173,8 +180,7 @@ def check_time(time_str: str) -> None:
     ----------
     time_str : str
     """
-    regex = r"(\d{1}\-\d{2}\:\d{2}\:\d{2})"
-    assert fullmatch(regex, time_str), f"Time entry [{time_str}] is invalid"
+    assert _TIME_RE.fullmatch(time_str), f"Time entry [{time_str}] is invalid"
 
 
 class UseJSON(Dict[str, str]):
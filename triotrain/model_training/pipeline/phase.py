@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
 def process_phase(txt: str) -> str:
     """
     Handle any special characters and only use '_' as a separator.
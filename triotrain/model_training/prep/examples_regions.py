@@ -209,8 +209,8 @@ class MakeRegions:
             if "ignore" in self.itr.args:
                 if isinstance(self.itr.args.ignore, str):
                     exclude_list.append(self.itr.args.ignore)
-                elif isinstance(self.itr.args.ignore, list):
-                    merged_list = exclude_list + self.itr.args.ignore
+                elif isinstance(self.itr.args.ignore, (list, tuple)):
+                    merged_list = exclude_list + list(self.itr.args.ignore)
                     exclude_list = merged_list
 
             # remove any duplicates
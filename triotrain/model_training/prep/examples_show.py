@@ -23,7 +23,7 @@ from sys import exit
 from typing import List, Union
 
 from helpers.iteration import Iteration
-from helpers.outputs import check_if_output_exists
+from helpers.outputs import has_any_output
 from helpers.utils import (
     check_if_all_same,
     generate_job_id,
@@ -405,19 +405,7 @@ class ShowExamples:
         self.png_regex = rf"{self.regions_path.stem}\w+:\w+->\w+.\w+.png"
 
         # See if PNGs made using the region file already exist
-        (
-            self._existing_pngs,
-            pngs_found,
-            png_files,
-        ) = check_if_output_exists(
-            self.png_regex,
-            "image PNGs",
-            self.pileup_path,
-            self.logger_msg,
-            self.itr.logger,
-            debug_mode=self.itr.debug_mode,
-            dryrun_mode=self.itr.dryrun_mode,
-        )
+        self._existing_pngs = has_any_output(self.png_regex, self.pileup_path)
 
         if self._existing_pngs and self.overwrite is False:
             self.itr.logger.warning(
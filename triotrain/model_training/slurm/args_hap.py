@@ -53,6 +53,20 @@ def collect_args():
         help="if True, display final hap.py metrics to the screen",
         action="store_true",
     )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        dest="threads",
+        help="number of chromosomes to query in parallel with 'bcftools query'\n(default: %(default)s)",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--no-tsv",
+        dest="materialize",
+        help="if True, count metrics directly from 'bcftools query' without writing the intermediate TSV file",
+        action="store_false",
+    )
 
     return parser.parse_args()
     # return parser.parse_args(
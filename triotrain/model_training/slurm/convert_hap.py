@@ -9,10 +9,14 @@ example:
 import argparse
 from dataclasses import dataclass, field
 from logging import Logger
-from os import environ, getcwd
+from os import environ, fspath, getcwd
 from pathlib import Path
+from shutil import copyfileobj
+from subprocess import PIPE, CalledProcessError, Popen
 from subprocess import run as run_sub
 from sys import path
+from tempfile import TemporaryDirectory
+from typing import Iterator, Union
 
 from regex import compile
 
@@ -20,6 +24,8 @@ abs_path = Path(__file__).resolve()
 module_path = str(abs_path.parent.parent.parent)
 path.append(module_path)
 from helpers.environment import Env
+from helpers.files import replace_when_done
+from helpers.vcf_to_tsv import count_query_columns, list_contigs, query_by_contig
 from suffix import remove_suffixes
 
 
@@ -38,6 +44,9 @@ class Convert:
     _version: str = field(
         default=str(environ.get("BIN_VERSION_DV")), init=False, repr=False
     )
+    _query_tmp_dir: Union[TemporaryDirectory, None] = field(
+        default=None, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         self.happy_vcf_file_path = Path(self.args.vcf_file)
@@ -234,23 +243,78 @@ class Convert:
 
     def convert_to_tsv(self) -> None:
         """
-        Run 'bcftools query' as a Python Subprocess, and write the output to an intermediate file.
+        Run 'bcftools query' as a Python Subprocess, and stream the output to an intermediate file in 64 KB chunks, rather than holding it all in memory.
+
+        When process_hap.py will count metrics next, the output is left in the pipe to be read through stream_lines() instead.
+
+        With --dry-run or --no-tsv and an existing CSV file, nothing would read the output, so 'bcftools query' is not run.
+        """
+        _write_tsv = (
+            not self.args.dry_run and self.args.materialize and not self.missing_csv
+        )
+        if not _write_tsv and not self.missing_csv:
+            if self.args.debug:
+                self.logger.debug(
+                    f"{self._logger_msg}: skipping 'bcftools query', as the TSV file would not be written or used"
+                )
+            return
+
+        self.start_query()
+
+        if _write_tsv:
+            # Copy the query output as bytes, and only replace
+            # the TSV once 'bcftools query' has succeeded
+            with replace_when_done(self.file_tsv, mode="wb") as file:
+                # Add custom header to the new TSV
+                file.write(self.header_bytes())
+                copyfileobj(self._bcftools_query.stdout, file, 1 << 16)
+                self.finish_query()
+
+    def start_query(self) -> None:
+        """
+        Launch 'bcftools query', with the output left in a pipe for either convert_to_tsv() or stream_lines() to read.
         """
         # Perform a bcftools query search for all loci within
         #   CALLABLE_REGIONS FILE
         #   Thus dropping all loci/positions which are NOT
         #   contained in the truth regions file
-        bcftools_query = run_sub(
-            [
+        _output_format = "%CHROM\t%POS[\t%BD\t%GT\t%BVT\t%BLT\t%BI]\n"
+        self.check_columns(_output_format)
+
+        _contigs = (
+            list_contigs(fspath(self.happy_vcf_file_path))
+            if self.args.threads > 1
+            else None
+        )
+        if self.args.threads > 1 and _contigs is None:
+            self.logger.warning(
+                f"{self._logger_msg}: unable to split 'bcftools query' by chromosome, as the VCF is not indexed | '{self.happy_vcf_file_path.name}'"
+            )
+
+        if _contigs is not None and len(_contigs) > 1:
+            # query each chromosome in parallel, then join them back in order
+            self._query_tmp_dir = TemporaryDirectory(dir=self.file_tsv.parent)
+            _contig_files = query_by_contig(
+                fspath(self.happy_vcf_file_path),
+                _contigs,
+                _output_format,
+                self._query_tmp_dir.name,
+                self.args.threads,
+            )
+            _command = ["cat", *_contig_files]
+        else:
+            _command = [
                 "bcftools",
                 "query",
                 "-f",
-                "%CHROM\t%POS[\t%BD\t%GT\t%BVT\t%BLT\t%BI]\n",
-                str(self.happy_vcf_file_path),
-            ],  # type: ignore
-            capture_output=True,
-            text=True,
-            check=True,
+                _output_format,
+                self.happy_vcf_file_path,
+            ]
+
+        self._bcftools_query = Popen(
+            _command,  # type: ignore
+            stdout=PIPE,
+            bufsize=1 << 16,
         )
 
         if self.args.debug:
@@ -258,16 +322,59 @@ class Convert:
                 f"{self._logger_msg}: writing TSV metrics file using | '{self.happy_vcf_file_path.name}'"
             )
 
-        if not self.args.dry_run:
-            file = open(str(self.file_tsv), mode="w")
-            # Add custom header to the new TSV
-            file.write("\t".join(self._custom_header[0:]) + "\n")
-            file.close()
-            contents = open(str(self.file_tsv), mode="a")
-            contents.write(bcftools_query.stdout)
-            contents.close()
+    def check_columns(self, output_format: str) -> None:
+        """
+        Confirm the 'bcftools query' format matches the custom header, before any records are queried.
+
+        Only the sample names are read, with 'bcftools query -l'.
+        """
+        _samples = run_sub(
+            ["bcftools", "query", "-l", self.happy_vcf_file_path],  # type: ignore
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        _n_cols_expected = count_query_columns(output_format, len(_samples))
+        assert _n_cols_expected == len(
+            self._custom_header
+        ), f"unexpected column headers | {_n_cols_expected} != {len(self._custom_header)}"
+
+    def stream_lines(self) -> Iterator[str]:
+        """
+        Yield each line of 'bcftools query' output as it is produced.
+
+        Unless using --dry-run or --no-tsv, each line is also written to the intermediate TSV file in the same pass, so the TSV is not re-read from disk. The TSV is only renamed into place once bcftools has succeeded.
+        """
+        if not self.args.dry_run and self.args.materialize:
+            with replace_when_done(self.file_tsv, mode="wb") as file:
+                # Add custom header to the new TSV
+                file.write(self.header_bytes())
+                for line in self._bcftools_query.stdout:
+                    file.write(line)
+                    yield line.decode()
+                self.finish_query()
         else:
-            self.tsv_format = bcftools_query.stdout.splitlines()
+            for line in self._bcftools_query.stdout:
+                yield line.decode()
+            self.finish_query()
+
+    def header_bytes(self) -> bytes:
+        """
+        Encode the custom TSV header line once, for writing in binary mode.
+        """
+        return ("\t".join(self._custom_header) + "\n").encode()
+
+    def finish_query(self) -> None:
+        """
+        Wait for 'bcftools query' to exit, and confirm it was successful.
+        """
+        self._bcftools_query.stdout.close()
+        _returncode = self._bcftools_query.wait()
+        if self._query_tmp_dir is not None:
+            self._query_tmp_dir.cleanup()
+            self._query_tmp_dir = None
+        if _returncode != 0:
+            raise CalledProcessError(_returncode, self._bcftools_query.args)
 
         if self.args.debug:
             self.logger.debug(f"{self._logger_msg}: done converting to TSV file")
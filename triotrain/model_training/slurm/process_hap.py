@@ -10,6 +10,7 @@ import argparse
 from collections import OrderedDict, defaultdict
 from csv import DictReader, reader
 from dataclasses import dataclass, field
+from itertools import product
 from logging import Logger
 from operator import itemgetter
 from os import path as p
@@ -17,7 +18,7 @@ from pathlib import Path
 from subprocess import PIPE, Popen
 from subprocess import run as run_sub
 from sys import exit, path
-from typing import DefaultDict, Union
+from typing import DefaultDict, List, Union
 
 abs_path = Path(__file__).resolve()
 module_path = str(abs_path.parent.parent.parent)
@@ -25,7 +26,7 @@ path.append(module_path)
 from args_hap import check_args, collect_args
 from convert_hap import Convert
 from helpers.dictionary import add_to_dict
-from helpers.files import WriteFiles
+from helpers.files import WriteFiles, mapped_lines
 
 
 @dataclass
@@ -100,6 +101,15 @@ class Process:
         ]
         self._logger_msg = f"[{self.convert_happy._mode}] - [{self._phase}] - [{self.convert_happy._test_msg}]"
 
+    def add_default_counts(self, combinations: List[str]) -> None:
+        """
+        Start a count of zero for each metric combination not already being counted.
+        """
+        for new_combo in combinations:
+            if new_combo not in self._counts_default_dict.keys():
+                # assigning to a variable prints fewer confusing msgs
+                quiet = self._counts_default_dict[new_combo]
+
     def type_filter(self) -> None:
         """
         Filter metrics based on variant type, meaning count per SNP/INDEL/NOCALL metrics.
@@ -116,15 +126,11 @@ class Process:
             "test_variant_type",
         ]
         TypeList = ["SNP", "INDEL", "NOCALL"]
-        self._type_combinations = []
-        for combo in self._combinations:
-            for t in TypeList:
-                for t2 in TypeList:
-                    new_combo = f"{combo}_{t}_{t2}"
-                    self._type_combinations.append(new_combo)
-                    if new_combo not in self._counts_default_dict.keys():
-                        # assigning to a variable prints fewer confusing msgs
-                        quiet = self._counts_default_dict[new_combo]
+        self._type_combinations = [
+            f"{combo}_{t}_{t2}"
+            for combo, t, t2 in product(self._combinations, TypeList, TypeList)
+        ]
+        self.add_default_counts(self._type_combinations)
 
     def get_sampleID(self) -> None:
         """
@@ -165,14 +171,10 @@ class Process:
         self.expected_num_metrics = len(self._combinations) * 4
         self._columns = ["test_genotype_class", "truth_label", "test_label"]
         ClassList = ["homalt", "nocall", "het", "hetalt"]
-        self._class_combinations = []
-        for combo in self._combinations:
-            for C in ClassList:
-                new_combo = f"{combo}_{C}"
-                self._class_combinations.append(new_combo)
-                if new_combo not in self._counts_default_dict.keys():
-                    # assigning to a variable prints fewer confusing msgs
-                    quiet = self._counts_default_dict[new_combo]
+        self._class_combinations = [
+            f"{combo}_{C}" for combo, C in product(self._combinations, ClassList)
+        ]
+        self.add_default_counts(self._class_combinations)
 
     def chr_filter(self) -> None:
         """
@@ -181,14 +183,11 @@ class Process:
         self.expected_num_metrics = len(self._combinations) * 29
         self._columns = ["chromosome", "truth_label", "test_label"]
 
-        self._chr_combinations = []
-        for combo in self._combinations:
-            for c in self.convert_happy.CHR:
-                new_combo = f"{c}_{combo}"
-                self._chr_combinations.append(new_combo)
-                if new_combo not in self._counts_default_dict.keys():
-                    # assigning to a variable prints fewer confusing msgs
-                    quiet = self._counts_default_dict[new_combo]
+        self._chr_combinations = [
+            f"{c}_{combo}"
+            for combo, c in product(self._combinations, self.convert_happy.CHR)
+        ]
+        self.add_default_counts(self._chr_combinations)
 
     def create_metadata(self) -> None:
         """
@@ -337,15 +336,19 @@ class Process:
         """
         # Confirm input data is an existing file
         if self.convert_happy.file_tsv.exists():
-            with open(self.convert_happy.file_tsv, mode="r") as data:
-                # Open the file as read only
-                for line in DictReader(data, delimiter="\t"):
+            with mapped_lines(self.convert_happy.file_tsv) as _lines:
+                for line in DictReader(
+                    (line.decode() for line in _lines), delimiter="\t"
+                ):
                     self.count_metrics(line=line, show_weirdos=reload)
         else:
-            if self.args.dry_run:
-                # stream in the convert-tsv stdout to process without writing an intermediate file
+            if self.convert_happy.missing_tsv:
+                # the first pass already consumed the 'bcftools query' pipe
+                if reload:
+                    self.convert_happy.start_query()
+                # stream in the convert-tsv stdout, rather than re-reading the intermediate file
                 for line in DictReader(
-                    self.convert_happy.tsv_format,
+                    self.convert_happy.stream_lines(),
                     fieldnames=self.convert_happy._custom_header,
                     delimiter="\t",
                 ):
@@ -23,10 +23,10 @@ from helpers.iteration import Iteration
 from helpers.utils import create_deps, get_logger
 from helpers.wrapper import Wrapper, timestamp
 from model_training.pipeline.args import (
+    DEFAULT_CHANNELS,
     check_args,
     collect_args,
     get_args,
-    get_defaults,
 )
 from model_training.pipeline.initialize import initalize_weights
 from model_training.pipeline.run import RunTrioTrain
@@ -43,7 +43,6 @@ def run_trio_train(eval_genome="Child") -> None:
     """
     # Collect command line arguments
     parser = collect_args()
-    channel_defaults = get_defaults(parser, "channel_info")
     args = get_args(parser=parser)
 
     # Collect start time
@@ -55,7 +54,7 @@ def run_trio_train(eval_genome="Child") -> None:
     logger = get_logger(module_name)
 
     # Check command line args
-    check_args(args=args, logger=logger, default_channels=channel_defaults)
+    check_args(args=args, logger=logger, default_channels=DEFAULT_CHANNELS)
 
     # Process any trio dependencies in args
     convert = lambda i: None if i == "None" else str(i)
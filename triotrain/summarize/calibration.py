@@ -7,7 +7,7 @@ example:
 """
 
 import argparse
-from csv import DictReader
+from csv import reader
 from logging import Logger
 from os import environ
 from os import path as p
@@ -39,7 +39,7 @@ def collect_args() -> argparse.Namespace:
         "--input",
         dest="vcf_input",
         type=str,
-        help="[REQUIRED]\ninput file (.VCF)",
+        help="[REQUIRED]\ninput file (.VCF or .BCF)",
         metavar="</path/file>",
     )
     parser.add_argument(
@@ -64,6 +64,15 @@ def collect_args() -> argparse.Namespace:
         help="output path prefix; directory will be created if necessary",
         metavar="</path/prefix>",
     )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        dest="threads",
+        type=int,
+        help="number of contigs to query in parallel; requires an indexed VCF\n(default: %(default)s)",
+        default=1,
+        metavar="<int>",
+    )
     # return parser.parse_args()
     return parser.parse_args(
         [
@@ -144,6 +153,7 @@ def __init__() -> None:
             debug=args.debug,
             dry_run=args.dry_run,
             logger_msg=_logger_msg,
+            threads=args.threads,
         )
         mie_vcf.check_files()
     except AssertionError as E:
@@ -160,12 +170,15 @@ def __init__() -> None:
         
         # print("STOPPING HERE!")
         # breakpoint()
-        with open(str(_processed_file.path), mode="r", encoding="utf-8-sig") as data:
-            dict_reader = DictReader(data, delimiter="\t")
-            _tsv_dict_array = list(dict_reader)
-
-        # Sort the Min. GQ from smallest to largest
-        sorted_dict_array = sorted(_tsv_dict_array, key=lambda x: x["INFO/MIN_GQ"])
+        with open(
+            str(_processed_file.path), mode="r", newline="", encoding="utf-8-sig"
+        ) as data:
+            _rows = reader(data, delimiter="\t")
+            _header = next(_rows)
+            _min_gq_col = _header.index("INFO/MIN_GQ")
+            _is_mie_col = _header.index("IS_MIE")
+            # Only keep the columns used for binning; row order does not matter here
+            _gq_mie_values = [(row[_min_gq_col], row[_is_mie_col]) for row in _rows]
         logger.info(
             f"{_internal_msg}done loading in processed TSV | '{_processed_file.path.name}'"
         )
@@ -189,13 +202,18 @@ def __init__() -> None:
         #       the number of sites "checked for Mendelian constraints"
 
         _num_MissingRef_Records = 0
-        for itr, row in enumerate(mie_vcf._tsv_dict_array):
-            print(f"ROW {itr} | {row}")
-            breakpoint()
+
+        # Look up column positions once, rather than per row
+        _header = mie_vcf._tsv_header
+        _gt_cols = [i for i, key in enumerate(_header) if key.startswith("GT")]
+        _gq_cols = [i for i, key in enumerate(_header) if key.startswith("GQ")]
+        _mcv_col = mie_vcf._col_idx["INFO/MCV"]
+
+        for itr, row in enumerate(mie_vcf._tsv_rows):
             if args.debug and itr % 5000 == 0:
                 logger.debug(f"{_internal_msg}processing row {itr}")
 
-            gt_values = [val for key, val in row.items() if key.startswith("GT")]
+            gt_values = [row[i] for i in _gt_cols]
 
             # First, skip uncalled in offspring
             if gt_values[0] == "./.":
@@ -212,13 +230,9 @@ def __init__() -> None:
                     _num_Non_Ref_Family_Records += 1
 
             # Calculate minimum GQ value per site for all samples
-            _row_copy = row.copy()
+            _row_copy = dict(zip(_header, row))
             
-            gq_values = [
-                None if val == "." else int(val)
-                for key, val in row.items()
-                if key.startswith("GQ")
-            ]
+            gq_values = [None if row[i] == "." else int(row[i]) for i in _gq_cols]
             min_gq = (
                 min(filter(lambda x: x is not None, gq_values))
                 if any(gq_values)
@@ -227,18 +241,21 @@ def __init__() -> None:
             _row_copy["INFO/MIN_GQ"] = min_gq
 
             # Transform Mendelian Violations to boolean for efficient counting
-            if row["INFO/MCV"] != ".":
+            if row[_mcv_col] != ".":
                 _row_copy["IS_MIE"] = 1
             else:
                 _row_copy["IS_MIE"] = 0
 
             # Save transformations to the copy made
-            _edited_tsv_dict_array.insert(itr, _row_copy)
+            _edited_tsv_dict_array.append(_row_copy)
 
         # Sort the Min. GQ from smallest to largest
         sorted_dict_array = sorted(
             _edited_tsv_dict_array, key=lambda x: x["INFO/MIN_GQ"]
         )
+        _gq_mie_values = [
+            (row["INFO/MIN_GQ"], row["IS_MIE"]) for row in sorted_dict_array
+        ]
 
         logger.info(
             f"{_internal_msg}done processing contents from VCF -> TSV | '{mie_vcf._output_file.path.name}'"
@@ -267,14 +284,10 @@ def __init__() -> None:
     _num_mie.create_bins()
     # print(f"NUM MIE BINS: {_num_mie._sdict}")
 
-    for itr, row in enumerate(sorted_dict_array):
-        _min_gq_value = int(row["INFO/MIN_GQ"])
-        _mie_value = int(row["IS_MIE"])
+    for min_gq, is_mie in _gq_mie_values:
+        _min_gq_value = int(min_gq)
         _counts[_min_gq_value] += 1
-        _num_mie[_min_gq_value] += _mie_value
-        # print(f"COUNTS BINS {itr}: {_counts._sdict}")
-        # print(f"NUM MIE BINS {itr}: {_num_mie._sdict}")
-        # breakpoint()
+        _num_mie[_min_gq_value] += int(is_mie)
 
     # Transform the two summary dicts into a pd.DataFrame
     summary_data = {
@@ -9,7 +9,7 @@ import fnmatch
 from dataclasses import dataclass, field
 from pathlib import Path
 from sys import exit
-from typing import List, Union
+from typing import List, Sequence, Union
 
 from helpers.files import WriteFiles
 from helpers.iteration import Iteration
@@ -18,6 +18,7 @@ from helpers.outputs import check_expected_outputs, check_if_output_exists
 from helpers.utils import (
     check_if_all_same,
     create_deps,
+    create_deps_view,
     find_NaN,
     find_not_NaN,
     generate_job_id,
@@ -51,8 +52,8 @@ class CallVariants:
         default_factory=list, repr=False, init=False
     )
     _phase: str = field(default="call_variants", init=False, repr=False)
-    _select_ckpt_job: Union[List[Union[str, None]], None] = field(
-        default_factory=list, repr=False, init=False
+    _select_ckpt_job: Union[Sequence[Union[str, None]], None] = field(
+        default_factory=tuple, repr=False, init=False
     )
     _skipped_counter: int = field(default=0, init=False, repr=False)
     _skip_phase: bool = field(default=False, init=False, repr=False)
@@ -68,9 +69,9 @@ class CallVariants:
         self.n_parts = self.slurm_resources[self._phase]["ntasks"]
 
         if self.itr.current_genome_dependencies[3] is not None:
-            self._select_ckpt_job = [self.itr.current_genome_dependencies[3]]
+            self._select_ckpt_job = (self.itr.current_genome_dependencies[3],)
         else:
-            self._select_ckpt_job = create_deps(num=1)
+            self._select_ckpt_job = create_deps_view(num=1)
 
         self._compare_dependencies = create_deps(num=self.itr.total_num_tests)
 